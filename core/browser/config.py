@@ -18,6 +18,10 @@ class ProxyConfig:
     address: str = "127.0.0.1:8080"
     username: Optional[str] = None
     password: Optional[str] = None
+    
+    def __post_init__(self):
+        """Normalize proxy type so lookups can compare directly."""
+        self.type = self.type.lower()
 
 
 @dataclass
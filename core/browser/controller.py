@@ -10,30 +10,102 @@ import socket
 import multiprocessing
 import threading
 import random
+import concurrent.futures
+import functools
 import tempfile
+import shutil
 import logging
+import re
+import importlib.util
 from typing import Optional
 from pathlib import Path
 
-import undetected_chromedriver as uc
 from selenium.webdriver.remote.webdriver import WebDriver
 
 from toolkit.core.browser.config import BrowserConfig, StealthConfig
 from toolkit.core.browser.window import WindowManager
-from toolkit.core.browser.proxy import ProxyManager
+from toolkit.core.browser.proxy import ProxyManager, _find_environment_proxy_vars
 
-# Enhanced features imports
-try:
-    from selenium_stealth import stealth
-    STEALTH_AVAILABLE = True
-except ImportError:
-    STEALTH_AVAILABLE = False
+# Enhanced features are imported lazily on first use
+STEALTH_AVAILABLE = importlib.util.find_spec("selenium_stealth") is not None
+FAKE_USERAGENT_AVAILABLE = importlib.util.find_spec("fake_useragent") is not None
 
-try:
-    from fake_useragent import UserAgent
-    FAKE_USERAGENT_AVAILABLE = True
-except ImportError:
-    FAKE_USERAGENT_AVAILABLE = False
+# Static Chrome flags applied on every start attempt
+_STATIC_CHROME_ARGS: tuple[str, ...] = (
+    # Essential stability options
+    "--disable-gpu",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-web-security",
+    "--disable-features=VizDisplayCompositor",
+    # Anti-detection options
+    "--disable-blink-features=AutomationControlled",
+    # Additional isolation options
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-features=TranslateUI",
+    "--disable-ipc-flooding-protection",
+    "--disable-logging",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-translate",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-domain-reliability",
+)
+
+_STATIC_PREFS: dict = {
+    "credentials_enable_service": False,
+    "profile.password_manager_enabled": False,
+    "translate": {"enabled": False},
+    "profile.default_content_setting_values": {
+        "notifications": 2,
+        "geolocation": 2,
+        "media_stream": 2,
+    }
+}
+
+# Startup errors that warrant a longer backoff before retrying
+_RETRYABLE_ERR = re.compile(
+    r'eof|connection|port|address already in use|chrome|driver|browser|initialization|timeout'
+)
+
+# Hosts contacted by the ChromeDriver patcher
+_CHROMEDRIVER_HOSTS = (
+    'chromedriver.storage.googleapis.com',
+    'storage.googleapis.com',
+    'www.googleapis.com'
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve(host: str) -> str:
+    """Resolve a hostname to its first IPv4 address, cached for the process lifetime."""
+    return socket.gethostbyname_ex(host)[2][0]
+
+
+def _pick_free_port() -> int:
+    """Ask the OS for a currently unused local TCP port."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+# Shared UserAgent instance; building it parses the full UA dataset
+_UA_SINGLETON = None
+_UA_LOCK = threading.Lock()
+
+
+def _get_ua_pool():
+    """Return the process-wide UserAgent instance, creating it on first use."""
+    global _UA_SINGLETON
+    if _UA_SINGLETON is None:
+        with _UA_LOCK:
+            if _UA_SINGLETON is None:
+                from fake_useragent import UserAgent
+                _UA_SINGLETON = UserAgent()
+    return _UA_SINGLETON
 
 
 class WebDriverController:
@@ -48,7 +120,13 @@ class WebDriverController:
     _chromedriver_download_lock = None
     _chromedriver_initialized = False
     _cache_dir = None
-    _dns_resolved = False
+    _uc = None
+    _dns_cache: dict[str, tuple[str, float]] = {}
+    _dns_ttl = 300.0
+    _dns_lock = threading.Lock()
+    _dns_event = threading.Event()
+    _env_proxy_checked = False
+    _env_proxy_found = False
     
     def __init__(self, config: BrowserConfig):
         """
@@ -83,47 +161,86 @@ class WebDriverController:
             cache_dir.mkdir(exist_ok=True)
             cls._cache_dir = cache_dir
     
+    @classmethod
+    def _get_uc(cls):
+        """Import undetected_chromedriver on first use and cache the module."""
+        if cls._uc is None:
+            import undetected_chromedriver
+            cls._uc = undetected_chromedriver
+        return cls._uc
+    
+    @classmethod
+    def _stale_dns_hosts(cls) -> list[str]:
+        """Return ChromeDriver hosts missing from the DNS cache or past their TTL."""
+        now = time.monotonic()
+        return [
+            host for host in _CHROMEDRIVER_HOSTS
+            if host not in cls._dns_cache or now - cls._dns_cache[host][1] >= cls._dns_ttl
+        ]
+    
     def _pre_resolve_chromedriver_hosts(self):
-        """Pre-resolve ChromeDriver hostnames to reduce DNS lookup time."""
-        if WebDriverController._dns_resolved:
+        """Pre-resolve ChromeDriver hostnames concurrently to reduce DNS lookup time."""
+        cls = WebDriverController
+        if cls._dns_event.is_set() and not cls._stale_dns_hosts():
             return
         
-        hosts = [
-            'chromedriver.storage.googleapis.com',
-            'storage.googleapis.com',
-            'www.googleapis.com'
-        ]
+        if not cls._dns_lock.acquire(blocking=False):
+            # Another controller is resolving; reuse its results once ready
+            cls._dns_event.wait(timeout=2.0)
+            return
         
-        self.logger.debug("Pre-resolving ChromeDriver hostnames...")
-        for host in hosts:
+        try:
+            pending = cls._stale_dns_hosts()
+            if not pending:
+                return
+            
+            # Expired entries must bypass the process-wide resolver cache
+            if any(host in cls._dns_cache for host in pending):
+                _resolve.cache_clear()
+            
+            self.logger.debug("Pre-resolving ChromeDriver hostnames...")
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(pending))
             try:
-                socket.gethostbyname(host)
-            except socket.gaierror:
-                pass
-        
-        WebDriverController._dns_resolved = True
-        self.logger.debug("DNS pre-resolution completed")
+                futures = {executor.submit(_resolve, host): host for host in pending}
+                done, _ = concurrent.futures.wait(futures, timeout=1.5)
+                for future in done:
+                    try:
+                        ip = future.result()
+                    except (OSError, IndexError):
+                        continue
+                    cls._dns_cache[futures[future]] = (ip, time.monotonic())
+            finally:
+                # Don't block start() on lookups that exceeded the timeout
+                executor.shutdown(wait=False)
+            
+            self.logger.debug("DNS pre-resolution completed")
+        finally:
+            cls._dns_event.set()
+            cls._dns_lock.release()
     
     def _detect_environment_proxy(self) -> bool:
         """Detect proxy settings from environment variables."""
-        proxy_vars = ['HTTP_PROXY', 'HTTPS_PROXY', 'http_proxy', 'https_proxy']
+        cls = WebDriverController
+        if cls._env_proxy_checked:
+            return cls._env_proxy_found
         
-        for var in proxy_vars:
-            if os.environ.get(var):
-                self.logger.debug(f"Detected proxy setting: {var}")
-                return True
+        hit = _find_environment_proxy_vars()
+        if hit:
+            self.logger.debug(f"Detected proxy setting: {next(iter(hit))}")
         
-        return False
+        cls._env_proxy_found = bool(hit)
+        cls._env_proxy_checked = True
+        return cls._env_proxy_found
     
     def _get_user_agent(self) -> str:
         """Generate or get user agent string."""
-        if self.config.user_agent:
-            if self.config.user_agent == "auto" or self.config.user_agent.lower() == "auto":
+        user_agent = self.config.user_agent
+        if user_agent:
+            if user_agent.lower() == "auto":
                 # Auto-generate random user agent
                 if FAKE_USERAGENT_AVAILABLE:
                     try:
-                        ua = UserAgent()
-                        return ua.random
+                        return _get_ua_pool().random
                     except Exception as e:
                         self.logger.warning(f"Failed to generate random user agent: {e}")
                 
@@ -131,7 +248,7 @@ class WebDriverController:
                 return "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
             else:
                 # Use provided user agent
-                return self.config.user_agent
+                return user_agent
         
         # Default user agent
         return "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
@@ -146,6 +263,7 @@ class WebDriverController:
             return
         
         try:
+            from selenium_stealth import stealth
             stealth_config = self.config.stealth
             stealth(
                 self.driver,
@@ -172,6 +290,28 @@ class WebDriverController:
             self.logger.warning(f"Driver health check failed: {e}")
             return False
     
+    def _ensure_chromedriver(self, uc):
+        """Download and patch ChromeDriver once per process."""
+        with WebDriverController._chromedriver_download_lock:
+            if WebDriverController._chromedriver_initialized:
+                return
+            try:
+                self.logger.debug("Pre-downloading ChromeDriver...")
+                patcher = uc.Patcher()
+                patcher.auto()
+                WebDriverController._chromedriver_initialized = True
+                self.logger.debug("ChromeDriver pre-download completed")
+            except Exception as e:
+                self.logger.warning(f"ChromeDriver pre-install failed: {e}")
+    
+    def _setup_user_data_dir(self):
+        """Set the Chrome profile directory, creating a temporary one if not configured."""
+        if self.config.user_data_dir:
+            self._user_data_dir = Path(self.config.user_data_dir)
+        else:
+            # Create a unique process-specific directory atomically
+            self._user_data_dir = Path(tempfile.mkdtemp(prefix=f"chrome_scraper_{os.getpid()}_"))
+    
     def start(self, headless: Optional[bool] = None) -> WebDriver:
         """
         Initialize and start the browser.
@@ -186,39 +326,22 @@ class WebDriverController:
             Exception: If browser initialization fails
         """
         headless = headless if headless is not None else self.config.headless
+        uc = self._get_uc()
         
         self.logger.info("Starting browser...")
         
-        # Phase 1: Network optimizations
-        self._pre_resolve_chromedriver_hosts()
+        # Phases 1-3 are independent: DNS warm-up, ChromeDriver download and
+        # profile directory creation run concurrently
         self._detect_environment_proxy()
-        
-        # Phase 2: ChromeDriver management
-        if not WebDriverController._chromedriver_initialized:
-            with WebDriverController._chromedriver_download_lock:
-                if not WebDriverController._chromedriver_initialized:
-                    try:
-                        self.logger.debug("Pre-downloading ChromeDriver...")
-                        patcher = uc.Patcher()
-                        patcher.auto()
-                        WebDriverController._chromedriver_initialized = True
-                        self.logger.debug("ChromeDriver pre-download completed")
-                    except Exception as e:
-                        self.logger.warning(f"ChromeDriver pre-install failed: {e}")
-        
-        # Phase 3: Setup user data directory
-        if self.config.user_data_dir:
-            self._user_data_dir = Path(self.config.user_data_dir)
-        else:
-            # Create process-specific directory
-            process_id = os.getpid()
-            thread_id = threading.get_ident()
-            random_port = random.randint(9222, 9999)
-            temp_dir = Path(tempfile.gettempdir())
-            self._user_data_dir = temp_dir / f"chrome_scraper_{process_id}_{thread_id}_{random_port}"
-            self._user_data_dir.mkdir(parents=True, exist_ok=True)
-        
-        random_port = random.randint(9222, 9999)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(self._pre_resolve_chromedriver_hosts),
+                executor.submit(self._setup_user_data_dir),
+            ]
+            if not WebDriverController._chromedriver_initialized:
+                futures.append(executor.submit(self._ensure_chromedriver, uc))
+            for future in futures:
+                future.result()
         
         # Phase 4: Initialize WebDriver with retry logic
         retry = 0
@@ -237,15 +360,9 @@ class WebDriverController:
                 options = uc.ChromeOptions()
                 options.headless = headless
                 
-                # Essential stability options
-                options.add_argument("--disable-gpu")
-                options.add_argument("--no-sandbox")
-                options.add_argument("--disable-dev-shm-usage")
-                options.add_argument("--disable-web-security")
-                options.add_argument("--disable-features=VizDisplayCompositor")
-                
-                # Anti-detection options
-                options.add_argument("--disable-blink-features=AutomationControlled")
+                # Static stability, anti-detection and isolation options;
+                # extend the underlying list instead of one add_argument per flag
+                options.arguments.extend(_STATIC_CHROME_ARGS)
                 
                 # User agent
                 user_agent = self._get_user_agent()
@@ -260,34 +377,10 @@ class WebDriverController:
                 
                 # User data directory and debugging port
                 options.add_argument(f"--user-data-dir={self._user_data_dir}")
-                options.add_argument(f"--remote-debugging-port={random_port}")
-                
-                # Additional isolation options
-                options.add_argument("--disable-background-timer-throttling")
-                options.add_argument("--disable-backgrounding-occluded-windows")
-                options.add_argument("--disable-renderer-backgrounding")
-                options.add_argument("--disable-features=TranslateUI")
-                options.add_argument("--disable-ipc-flooding-protection")
-                options.add_argument("--disable-logging")
-                options.add_argument("--disable-default-apps")
-                options.add_argument("--disable-sync")
-                options.add_argument("--disable-translate")
-                options.add_argument("--disable-background-networking")
-                options.add_argument("--disable-component-update")
-                options.add_argument("--disable-domain-reliability")
+                options.add_argument(f"--remote-debugging-port={_pick_free_port()}")
                 
                 # Preferences
-                prefs = {
-                    "credentials_enable_service": False,
-                    "profile.password_manager_enabled": False,
-                    "translate": {"enabled": False},
-                    "profile.default_content_setting_values": {
-                        "notifications": 2,
-                        "geolocation": 2,
-                        "media_stream": 2,
-                    }
-                }
-                options.add_experimental_option("prefs", prefs)
+                options.add_experimental_option("prefs", _STATIC_PREFS)
                 
                 # Initialize Chrome driver
                 self.driver = uc.Chrome(
@@ -319,10 +412,7 @@ class WebDriverController:
                 error_msg = str(e).lower()
                 self.logger.warning(f"Browser initialization failed (attempt {retry}/{max_retries + 1}): {e}")
                 
-                if any(keyword in error_msg for keyword in [
-                    "eof", "connection", "port", "address already in use",
-                    "chrome", "driver", "browser", "initialization", "timeout"
-                ]):
+                if _RETRYABLE_ERR.search(error_msg):
                     base_delay *= 2
                 
                 if retry > max_retries:
@@ -335,8 +425,9 @@ class WebDriverController:
         """Stop browser and clean up resources."""
         if self.driver:
             try:
-                # Check if driver is responsive
-                _ = self.driver.current_url
+                # Check if the chromedriver process is still running
+                if self._driver_process_alive() is False:
+                    raise RuntimeError("chromedriver process has exited")
                 self.driver.quit()
                 self.logger.info("Browser closed gracefully")
             except Exception as e:
@@ -347,22 +438,51 @@ class WebDriverController:
         # Cleanup user data directory if we created it
         if self._user_data_dir and self._user_data_dir.exists():
             try:
-                import shutil
-                shutil.rmtree(self._user_data_dir, ignore_errors=True)
-                self.logger.debug(f"Cleaned up user data directory: {self._user_data_dir}")
+                # Profile dirs hold thousands of small files; remove them off-thread
+                threading.Thread(
+                    target=shutil.rmtree,
+                    args=(self._user_data_dir,),
+                    kwargs={'ignore_errors': True},
+                    daemon=True
+                ).start()
+                self.logger.debug(f"Scheduled cleanup of user data directory: {self._user_data_dir}")
             except Exception as e:
                 self.logger.warning(f"Failed to cleanup user data directory: {e}")
     
-    def is_active(self) -> bool:
+    def _driver_process_alive(self) -> Optional[bool]:
+        """
+        Check the chromedriver subprocess without a WebDriver round-trip.
+        
+        Returns:
+            True/False if the process state is known, None otherwise
+        """
+        try:
+            process = self.driver.service.process
+        except AttributeError:
+            return None
+        if process is None:
+            return None
+        return process.poll() is None
+    
+    def is_active(self, probe: bool = False) -> bool:
         """
         Check if browser is running and responsive.
         
+        Args:
+            probe: Also query the browser for its current URL to confirm it responds
+        
         Returns:
             True if browser is active, False otherwise
         """
         if not self.driver:
             return False
         
+        alive = self._driver_process_alive()
+        if alive is False:
+            return False
+        if alive and not probe:
+            return True
+        
         try:
             _ = self.driver.current_url
             return True
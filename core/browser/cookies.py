@@ -9,6 +9,18 @@ from pathlib import Path
 from typing import Optional
 from selenium.webdriver.remote.webdriver import WebDriver
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Cookie keys accepted by WebDriver.add_cookie ('domain' is dropped to avoid mismatches)
+_COOKIE_ALLOWED = frozenset({
+    'name', 'value', 'path', 'secure',
+    'httpOnly', 'sameSite', 'expiry'
+})
+
 
 class CookieManager:
     """
@@ -58,20 +70,28 @@ class CookieManager:
             filepath.parent.mkdir(parents=True, exist_ok=True)
             
             # Save cookies to file
-            with open(filepath, 'w') as f:
-                json.dump(cookies, f, indent=2)
+            if ORJSON_AVAILABLE:
+                with open(filepath, 'wb') as f:
+                    f.write(orjson.dumps(cookies, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filepath, 'w') as f:
+                    json.dump(cookies, f, indent=2)
             
             self.logger.info(f"Saved {len(cookies)} cookies to {filepath}")
         except Exception as e:
             self.logger.error(f"Failed to save cookies: {e}")
     
-    def load_cookies(self, filepath: Path, domain: str):
+    def load_cookies(self, filepath: Path, domain: str, refresh: bool = False):
         """
         Load cookies from JSON file into browser session.
         
+        Cookies take effect on the next navigation, so callers that navigate
+        afterwards (the common case) should leave refresh disabled.
+        
         Args:
             filepath: Path to cookies JSON file
             domain: Domain to navigate to before loading cookies
+            refresh: Reload the current page after loading cookies
         """
         if not self.driver:
             self.logger.warning("No driver available for cookie management")
@@ -85,47 +105,39 @@ class CookieManager:
         
         try:
             # Load cookies from file
-            with open(filepath, 'r') as f:
-                cookies = json.load(f)
+            if ORJSON_AVAILABLE:
+                cookies = orjson.loads(filepath.read_bytes())
+            else:
+                with open(filepath, 'r') as f:
+                    cookies = json.load(f)
             
             # Navigate to domain (required for adding cookies)
             self.logger.info(f"Navigating to {domain} to add cookies...")
             self.driver.get(domain)
             
-            # Clear existing cookies
+            # Keep only well-formed cookies restricted to allowed keys
+            valid_cookies = []
+            for cookie in cookies:
+                if 'name' in cookie and 'value' in cookie:
+                    valid_cookies.append({
+                        k: cookie[k] for k in _COOKIE_ALLOWED if k in cookie
+                    })
+                else:
+                    self.logger.warning(f"Skipping invalid cookie: {cookie}")
+            
+            # Clears cookies for the current domain only, like the per-cookie path always did
             self.driver.delete_all_cookies()
-            self.logger.debug("Cleared all existing cookies")
+            self.logger.debug("Cleared existing cookies for current domain")
             
-            # Add cookies
-            added_count = 0
-            for cookie in cookies:
-                try:
-                    if 'name' in cookie and 'value' in cookie:
-                        # Remove 'domain' field to avoid domain mismatch
-                        simplified_cookie = {
-                            k: v for k, v in cookie.items() 
-                            if k != 'domain'
-                        }
-                        
-                        # Filter to allowed keys only
-                        allowed_keys = {
-                            'name', 'value', 'path', 'secure', 
-                            'httpOnly', 'sameSite', 'expiry'
-                        }
-                        simplified_cookie = {
-                            k: v for k, v in simplified_cookie.items() 
-                            if k in allowed_keys
-                        }
-                        
-                        self.driver.add_cookie(simplified_cookie)
-                        added_count += 1
-                    else:
-                        self.logger.warning(f"Skipping invalid cookie: {cookie}")
-                except Exception as e:
-                    self.logger.warning(f"Failed to add cookie {cookie.get('name', 'unknown')}: {e}")
+            # Chromium drivers accept the whole batch in one CDP call
+            if hasattr(self.driver, 'execute_cdp_cmd'):
+                added_count = self._add_cookies_cdp(valid_cookies, domain)
+            else:
+                added_count = self._add_cookies_individually(valid_cookies)
             
-            # Refresh page to apply cookies
-            self.driver.refresh()
+            # Refresh page to apply cookies only when requested
+            if refresh:
+                self.driver.refresh()
             self.logger.info(f"Loaded {added_count} cookies from {filepath}")
             
         except json.JSONDecodeError as e:
@@ -133,6 +145,63 @@ class CookieManager:
         except Exception as e:
             self.logger.error(f"Error loading cookies: {e}")
     
+    def _add_cookies_cdp(self, cookies: list[dict], url: str) -> int:
+        """
+        Add browser cookies using a single CDP Network.setCookies batch.
+        
+        CDP rejects the whole batch if any cookie is invalid; the cookies are
+        then added one at a time so only the bad ones are skipped.
+        
+        Args:
+            cookies: Filtered cookie dictionaries
+            url: URL the cookies are scoped to
+            
+        Returns:
+            Number of cookies added
+        """
+        cdp_cookies = []
+        for cookie in cookies:
+            cdp_cookie = {
+                'name': cookie['name'],
+                'value': cookie['value'],
+                'url': url,
+                'path': cookie.get('path', '/'),
+                'secure': cookie.get('secure', False),
+                'httpOnly': cookie.get('httpOnly', False),
+            }
+            if cookie.get('sameSite'):
+                cdp_cookie['sameSite'] = cookie['sameSite']
+            if cookie.get('expiry') is not None:
+                cdp_cookie['expires'] = cookie['expiry']
+            cdp_cookies.append(cdp_cookie)
+        
+        try:
+            self.driver.execute_cdp_cmd('Network.setCookies', {'cookies': cdp_cookies})
+        except Exception as e:
+            self.logger.warning(f"Batch cookie load failed, adding cookies individually: {e}")
+            return self._add_cookies_individually(cookies)
+        return len(cdp_cookies)
+    
+    def _add_cookies_individually(self, cookies: list[dict]) -> int:
+        """
+        Add browser cookies one WebDriver add_cookie call at a time.
+        
+        Args:
+            cookies: Filtered cookie dictionaries
+            
+        Returns:
+            Number of cookies added
+        """
+        added_count = 0
+        for cookie in cookies:
+            try:
+                self.driver.add_cookie(cookie)
+                added_count += 1
+            except Exception as e:
+                self.logger.warning(f"Failed to add cookie {cookie.get('name', 'unknown')}: {e}")
+        
+        return added_count
+    
     def get_cookies(self) -> list[dict]:
         """
         Get all cookies from current browser session.
@@ -7,6 +7,14 @@ import os
 from typing import Optional, Dict
 from toolkit.core.browser.config import ProxyConfig
 
+# Environment variables consulted for system proxy settings
+_PROXY_VARS = frozenset({'HTTP_PROXY', 'HTTPS_PROXY', 'http_proxy', 'https_proxy'})
+
+
+def _find_environment_proxy_vars() -> set[str]:
+    """Return the proxy environment variables that are set to a non-empty value."""
+    return {var for var in _PROXY_VARS & os.environ.keys() if os.environ[var]}
+
 
 class ProxyManager:
     """
@@ -15,6 +23,10 @@ class ProxyManager:
     Supports HTTP, SOCKS5, and Tor proxies.
     """
     
+    # Environment proxy detection is cached per process
+    _env_proxy_checked = False
+    _env_proxy_found = False
+    
     def __init__(self, config: Optional[ProxyConfig] = None):
         """
         Initialize ProxyManager.
@@ -25,47 +37,64 @@ class ProxyManager:
         self.config = config
         self.logger = logging.getLogger(self.__class__.__name__)
         self.proxies: Optional[Dict[str, str]] = None
+        self._proxy_args: list[str] = []
         
         if config and config.enabled:
             self._setup_proxies()
+        
+        # Proxy state is fixed once setup has run
+        self._enabled = bool(self.proxies) and bool(config and config.enabled)
     
     def _setup_proxies(self):
         """Setup proxy configuration from config."""
         if not self.config or not self.config.enabled:
             return
         
-        if self.config.type.lower() == "tor":
-            self.proxies = {
-                'http': 'socks5h://127.0.0.1:9150',
-                'https': 'socks5h://127.0.0.1:9150'
-            }
-            self.logger.info("Tor proxy configured")
-        elif self.config.type.lower() == "http":
-            self.proxies = {
-                'http': f"http://{self.config.address}",
-                'https': f"https://{self.config.address}"
-            }
-            if self.config.username and self.config.password:
-                self.proxies['http'] = f"http://{self.config.username}:{self.config.password}@{self.config.address}"
-                self.proxies['https'] = f"https://{self.config.username}:{self.config.password}@{self.config.address}"
-            self.logger.info(f"HTTP proxy configured: {self.config.address}")
-        elif self.config.type.lower() == "socks5":
-            self.proxies = {
-                'http': f"socks5://{self.config.address}",
-                'https': f"socks5://{self.config.address}"
-            }
-            self.logger.info(f"SOCKS5 proxy configured: {self.config.address}")
-        else:
+        builder = self._BUILDERS.get(self.config.type)
+        if builder is None:
             self.logger.warning(f"Unknown proxy type: {self.config.type}")
-    
-    def get_proxy_arguments(self) -> list[str]:
-        """
-        Get Chrome arguments for proxy configuration.
+        else:
+            builder(self)
         
-        Returns:
-            List of Chrome arguments for proxy setup
-        """
-        if not self.config or not self.config.enabled or not self.proxies:
+        self._proxy_args = self._build_proxy_arguments()
+    
+    def _build_tor_proxies(self):
+        """Configure the local Tor SOCKS proxy."""
+        self.proxies = {
+            'http': 'socks5h://127.0.0.1:9150',
+            'https': 'socks5h://127.0.0.1:9150'
+        }
+        self.logger.info("Tor proxy configured")
+    
+    def _build_http_proxies(self):
+        """Configure an HTTP proxy, with credentials if provided."""
+        self.proxies = {
+            'http': f"http://{self.config.address}",
+            'https': f"https://{self.config.address}"
+        }
+        if self.config.username and self.config.password:
+            self.proxies['http'] = f"http://{self.config.username}:{self.config.password}@{self.config.address}"
+            self.proxies['https'] = f"https://{self.config.username}:{self.config.password}@{self.config.address}"
+        self.logger.info(f"HTTP proxy configured: {self.config.address}")
+    
+    def _build_socks5_proxies(self):
+        """Configure a SOCKS5 proxy."""
+        self.proxies = {
+            'http': f"socks5://{self.config.address}",
+            'https': f"socks5://{self.config.address}"
+        }
+        self.logger.info(f"SOCKS5 proxy configured: {self.config.address}")
+    
+    # Proxy type (lowercased by ProxyConfig) -> builder
+    _BUILDERS = {
+        'tor': _build_tor_proxies,
+        'http': _build_http_proxies,
+        'socks5': _build_socks5_proxies,
+    }
+    
+    def _build_proxy_arguments(self) -> list[str]:
+        """Build Chrome arguments for the configured proxies."""
+        if not self.proxies:
             return []
         
         # For Chrome, we use --proxy-server argument
@@ -73,14 +102,26 @@ class ProxyManager:
         proxy_url = self.proxies.get('http', '')
         
         if proxy_url.startswith('socks5'):
-            # Convert socks5:// to socks5:// for Chrome
-            proxy_server = proxy_url.replace('socks5h://', 'socks5://').replace('socks5://', 'socks5://')
+            # Chrome does not understand socks5h://
+            proxy_server = proxy_url.replace('socks5h://', 'socks5://')
             return [f'--proxy-server={proxy_server}']
         elif proxy_url.startswith('http'):
             return [f'--proxy-server={proxy_url}']
         else:
             return []
     
+    def get_proxy_arguments(self) -> list[str]:
+        """
+        Get Chrome arguments for proxy configuration.
+        
+        Returns:
+            List of Chrome arguments for proxy setup
+        """
+        if not self.config or not self.config.enabled:
+            return []
+        
+        return self._proxy_args
+    
     def get_requests_proxies(self) -> Optional[Dict[str, str]]:
         """
         Get proxies dict for requests library.
@@ -97,14 +138,18 @@ class ProxyManager:
         Returns:
             True if proxy settings found in environment
         """
-        proxy_vars = ['HTTP_PROXY', 'HTTPS_PROXY', 'http_proxy', 'https_proxy']
+        cls = ProxyManager
+        if cls._env_proxy_checked:
+            return cls._env_proxy_found
         
-        for var in proxy_vars:
-            if os.environ.get(var):
-                self.logger.info(f"Detected proxy setting: {var}={os.environ.get(var)}")
-                return True
+        hit = _find_environment_proxy_vars()
+        if hit:
+            var = next(iter(hit))
+            self.logger.info(f"Detected proxy setting: {var}={os.environ.get(var)}")
         
-        return False
+        cls._env_proxy_found = bool(hit)
+        cls._env_proxy_checked = True
+        return cls._env_proxy_found
     
     def is_enabled(self) -> bool:
         """
@@ -113,5 +158,5 @@ class ProxyManager:
         Returns:
             True if proxy is enabled and configured
         """
-        return self.config is not None and self.config.enabled and self.proxies is not None
+        return self._enabled
 
@@ -5,7 +5,11 @@ Provides session state management, cookie handling, and requests.Session integra
 """
 
 import logging
+from collections import defaultdict
+from http.cookiejar import Cookie
 import requests
+from requests.adapters import HTTPAdapter
+from requests.cookies import RequestsCookieJar
 from typing import Optional
 from pathlib import Path
 from selenium.webdriver.remote.webdriver import WebDriver
@@ -13,6 +17,10 @@ from selenium.webdriver.remote.webdriver import WebDriver
 from toolkit.core.browser.controller import WebDriverController
 from toolkit.core.browser.cookies import CookieManager
 
+# Cookie copies its rest dict, so these can be shared across cookies
+_HTTPONLY_REST = {'HttpOnly': None}
+_NO_REST: dict = {}
+
 
 class BrowserSession:
     """
@@ -22,6 +30,11 @@ class BrowserSession:
     and integration with requests library for downloads.
     """
     
+    __slots__ = (
+        'controller', 'cookie_manager', 'logger', '_session',
+        '_cookies_cache', '_cookies_dirty', '_cookies_driver'
+    )
+    
     def __init__(self, controller: WebDriverController):
         """
         Initialize BrowserSession.
@@ -33,6 +46,14 @@ class BrowserSession:
         self.cookie_manager = CookieManager()
         self.logger = logging.getLogger(self.__class__.__name__)
         
+        # Pooled requests session shared across downloads
+        self._session: Optional[requests.Session] = None
+        
+        # Browser cookies are only re-fetched when marked dirty
+        self._cookies_cache: list[dict] = []
+        self._cookies_dirty = True
+        self._cookies_driver: Optional[WebDriver] = None
+        
         # Update cookie manager when driver becomes available
         if controller.driver:
             self.cookie_manager.set_driver(controller.driver)
@@ -51,49 +72,121 @@ class BrowserSession:
         self.cookie_manager.set_driver(self.controller.driver)
         self.cookie_manager.save_cookies(filepath)
     
-    def load_cookies(self, filepath: Path, domain: str):
+    def load_cookies(self, filepath: Path, domain: str, refresh: bool = False):
         """
         Load cookies from file into browser session.
         
         Args:
             filepath: Path to cookies JSON file
             domain: Domain to navigate to before loading cookies
+            refresh: Reload the current page after loading cookies
         """
         if not self.controller.driver:
             self.logger.warning("Browser not started, cannot load cookies")
             return
         
         self.cookie_manager.set_driver(self.controller.driver)
-        self.cookie_manager.load_cookies(filepath, domain)
+        self.cookie_manager.load_cookies(filepath, domain, refresh=refresh)
+        self._cookies_dirty = True
+    
+    def navigate(self, url: str):
+        """
+        Navigate the browser to a URL and mark cookies for re-sync.
+        
+        Args:
+            url: URL to load
+        """
+        if not self.controller.driver:
+            raise Exception("Browser is not started. Cannot navigate.")
+        
+        self.controller.driver.get(url)
+        self._cookies_dirty = True
+    
+    def mark_cookies_dirty(self):
+        """Force the next get_requests_session() call to re-read browser cookies."""
+        self._cookies_dirty = True
     
     def get_requests_session(self) -> requests.Session:
         """
         Get requests.Session with browser cookies and user agent.
         
+        The same session is returned on every call so its connection pool
+        is reused across downloads. Browser cookies are re-read only after
+        navigate(), load_cookies() or mark_cookies_dirty(). Handlers created
+        with this session navigate through navigate(); call
+        mark_cookies_dirty() after driving the browser any other way (e.g.
+        driver.get() or an in-page login).
+        
         Returns:
             requests.Session configured with browser cookies
         """
         if not self.controller.driver:
             raise Exception("Browser is not started. Cannot get session.")
         
-        session = requests.Session()
-        
-        # Get cookies from Selenium
-        selenium_cookies = self.controller.driver.get_cookies()
-        
-        # Convert Selenium cookies to requests-compatible format
-        for cookie in selenium_cookies:
-            session.cookies.set(
-                cookie['name'], 
-                cookie['value'], 
-                domain=cookie.get('domain')
-            )
+        session = self._session
+        if session is None:
+            session = self._create_requests_session()
+            self._session = session
+        
+        # Get cookies from Selenium only when they may have changed
+        driver = self.controller.driver
+        if self._cookies_dirty or driver is not self._cookies_driver:
+            self._cookies_cache = driver.get_cookies()
+            self._cookies_driver = driver
+            self._cookies_dirty = False
+            
+            # Convert Selenium cookies to requests-compatible format
+            session.cookies = self._build_cookie_jar(self._cookies_cache)
         
         # Set user-agent consistent with browser
         user_agent = self.controller.get_current_user_agent()
         if user_agent:
             session.headers.update({"User-Agent": user_agent})
         
+        return session
+    
+    @staticmethod
+    def _build_cookie_jar(selenium_cookies: list[dict]) -> RequestsCookieJar:
+        """Build a requests cookie jar from Selenium cookie dictionaries."""
+        # Bucket by domain so domain attributes are derived once per domain
+        by_domain: dict[str, list[dict]] = defaultdict(list)
+        for cookie in selenium_cookies:
+            by_domain[cookie.get('domain', '')].append(cookie)
+        
+        jar = RequestsCookieJar()
+        for domain, cookies in by_domain.items():
+            domain_specified = bool(domain)
+            domain_initial_dot = domain.startswith('.')
+            for cookie in cookies:
+                path = cookie.get('path', '/')
+                jar.set_cookie(Cookie(
+                    version=0,
+                    name=cookie['name'],
+                    value=cookie['value'],
+                    port=None,
+                    port_specified=False,
+                    domain=domain,
+                    domain_specified=domain_specified,
+                    domain_initial_dot=domain_initial_dot,
+                    path=path,
+                    path_specified=bool(path),
+                    secure=cookie.get('secure', False),
+                    expires=cookie.get('expiry'),
+                    discard=True,
+                    comment=None,
+                    comment_url=None,
+                    rest=_HTTPONLY_REST if cookie.get('httpOnly') else _NO_REST,
+                    rfc2109=False
+                ))
+        return jar
+    
+    def _create_requests_session(self) -> requests.Session:
+        """Create a pooled requests.Session with proxy settings applied."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        
         # Add proxy support if enabled
         if self.controller.proxy_manager and self.controller.proxy_manager.is_enabled():
             proxies = self.controller.proxy_manager.get_requests_proxies()
@@ -102,6 +195,13 @@ class BrowserSession:
         
         return session
     
+    def invalidate_session(self):
+        """Close and drop the cached requests.Session (e.g. after logout)."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        self._cookies_dirty = True
+    
     def get_cookies(self) -> list[dict]:
         """
         Get all cookies from current browser session.
@@ -120,5 +220,6 @@ class BrowserSession:
             return
         
         self.controller.driver.delete_all_cookies()
+        self._cookies_dirty = True
         self.logger.info("Deleted all cookies from session")
 
@@ -16,6 +16,8 @@ class WindowManager:
     and maintaining window state.
     """
     
+    __slots__ = ('driver', 'original_handle', '_original_target_id', 'logger')
+    
     def __init__(self, driver: Optional[WebDriver] = None):
         """
         Initialize WindowManager.
@@ -25,6 +27,7 @@ class WindowManager:
         """
         self.driver: Optional[WebDriver] = None
         self.original_handle: Optional[str] = None
+        self._original_target_id: Optional[str] = None
         self.logger = logging.getLogger(self.__class__.__name__)
         
         if driver:
@@ -38,8 +41,17 @@ class WindowManager:
             driver: WebDriver instance
         """
         self.driver = driver
+        self._original_target_id = None
         if driver and driver.window_handles:
             self.original_handle = driver.window_handles[0]
+            
+            # Chromium: remember the CDP target of the original window
+            if hasattr(driver, 'execute_cdp_cmd'):
+                try:
+                    info = driver.execute_cdp_cmd('Target.getTargetInfo', {})
+                    self._original_target_id = info['targetInfo']['targetId']
+                except Exception as e:
+                    self.logger.debug(f"CDP target lookup unavailable: {e}")
     
     def get_original_handle(self) -> Optional[str]:
         """
@@ -91,6 +103,55 @@ class WindowManager:
         if not self.original_handle:
             return 0
         
+        if self._original_target_id:
+            try:
+                closed_count = self._close_extra_windows_cdp()
+                if closed_count is not None:
+                    if closed_count > 0:
+                        self.logger.info(f"Closed {closed_count} extra window(s)")
+                    return closed_count
+            except Exception as e:
+                self.logger.debug(f"CDP window close failed, falling back: {e}")
+        
+        return self._close_extra_windows_generic()
+    
+    def _close_extra_windows_cdp(self) -> Optional[int]:
+        """
+        Close extra page targets through CDP without switching windows.
+        
+        Returns:
+            Number of windows closed, or None if the original target is gone
+        """
+        current = self.driver.execute_cdp_cmd('Target.getTargetInfo', {})
+        targets = self.driver.execute_cdp_cmd('Target.getTargets', {})['targetInfos']
+        pages = [t['targetId'] for t in targets if t.get('type') == 'page']
+        
+        if self._original_target_id not in pages:
+            return None
+        
+        closed_count = 0
+        for target_id in pages:
+            if target_id == self._original_target_id:
+                continue
+            try:
+                self.driver.execute_cdp_cmd('Target.closeTarget', {'targetId': target_id})
+                closed_count += 1
+            except Exception as e:
+                self.logger.warning(f"Failed to close window {target_id}: {e}")
+        
+        # Only switch back if the driver was focused on a closed window
+        if current['targetInfo']['targetId'] != self._original_target_id:
+            self.driver.switch_to.window(self.original_handle)
+        
+        return closed_count
+    
+    def _close_extra_windows_generic(self) -> int:
+        """
+        Close extra windows by switching to and closing each one.
+        
+        Returns:
+            Number of windows closed
+        """
         closed_count = 0
         try:
             current_handles = self.driver.window_handles
@@ -104,8 +165,11 @@ class WindowManager:
                     except Exception as e:
                         self.logger.warning(f"Failed to close window {handle}: {e}")
             
-            # Switch back to original window
-            self.ensure_active()
+            # Switch back to original window, reusing the handles already fetched
+            if self.original_handle in current_handles:
+                self.driver.switch_to.window(self.original_handle)
+            else:
+                self.ensure_active()
             
             if closed_count > 0:
                 self.logger.info(f"Closed {closed_count} extra window(s)")
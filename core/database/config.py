@@ -2,8 +2,9 @@
 Database configuration classes.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
+from sqlalchemy.engine import make_url
 
 
 @dataclass
@@ -16,8 +17,11 @@ class DatabaseConfig:
     pool_size: int = 5
     max_overflow: int = 10
     connect_args: Optional[dict] = None
+    sqlite_pragmas: Optional[dict] = None  # None = write-throughput defaults
+    dialect: str = field(init=False, default="")  # Backend name parsed from connection_string
     
     def __post_init__(self):
-        """Set default connect_args for SQLite if not provided."""
-        if self.connect_args is None and "sqlite" in self.connection_string.lower():
+        """Parse the backend dialect and set default connect_args for SQLite if not provided."""
+        self.dialect = make_url(self.connection_string).get_backend_name()
+        if self.connect_args is None and self.dialect == "sqlite":
             self.connect_args = {"check_same_thread": False}
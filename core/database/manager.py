@@ -3,12 +3,23 @@ Database connection and session management.
 """
 
 import logging
+import threading
 from typing import Optional, Generator
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session, scoped_session
 
 from toolkit.core.database.config import DatabaseConfig
 from toolkit.core.database.models import ModelBase
+from toolkit.core.database.repository import UnitOfWork
+
+# WAL journaling with deferred fsync, larger page cache and memory-mapped reads
+DEFAULT_SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "cache_size": -64000,
+    "temp_store": "MEMORY",
+    "mmap_size": 268435456,
+}
 
 
 class DatabaseManager:
@@ -18,12 +29,14 @@ class DatabaseManager:
     Provides engine, session factory, and schema management.
     """
     
-    def __init__(self, config: DatabaseConfig):
+    def __init__(self, config: DatabaseConfig, thread_scoped: bool = False):
         """
         Initialize DatabaseManager.
         
         Args:
             config: DatabaseConfig instance
+            thread_scoped: Build the thread-local scoped session factory up front
+                (otherwise it is created on first get_session() call)
         """
         self.config = config
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -38,6 +51,9 @@ class DatabaseManager:
             connect_args=config.connect_args or {}
         )
         
+        if config.dialect == "sqlite":
+            self._register_sqlite_pragmas()
+        
         # Create session factory
         self.session_factory = sessionmaker(
             autocommit=False,
@@ -45,8 +61,31 @@ class DatabaseManager:
             bind=self.engine
         )
         
-        # Create scoped session factory for thread safety
-        self.scoped_session_factory = scoped_session(self.session_factory)
+        # Scoped (thread-local) sessions are opt-in; plain sessions skip the registry
+        self.scoped_session_factory: Optional[scoped_session] = None
+        # Guards lazy creation so concurrent first calls share one registry
+        self._scoped_lock = threading.Lock()
+        if thread_scoped:
+            self.scoped_session_factory = scoped_session(self.session_factory)
+    
+    def _register_sqlite_pragmas(self):
+        """Apply configured PRAGMAs to every new SQLite connection."""
+        pragmas = self.config.sqlite_pragmas
+        if pragmas is None:
+            pragmas = DEFAULT_SQLITE_PRAGMAS
+        if not pragmas:
+            return
+        
+        statements = [f"PRAGMA {name}={value}" for name, value in pragmas.items()]
+        
+        @event.listens_for(self.engine, "connect")
+        def _set_sqlite_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            try:
+                for statement in statements:
+                    cursor.execute(statement)
+            finally:
+                cursor.close()
     
     def create_session(self) -> Session:
         """
@@ -64,8 +103,30 @@ class DatabaseManager:
         Returns:
             Scoped Session instance
         """
+        if self.scoped_session_factory is None:
+            with self._scoped_lock:
+                if self.scoped_session_factory is None:
+                    self.scoped_session_factory = scoped_session(self.session_factory)
         return self.scoped_session_factory()
     
+    def remove_scoped(self):
+        """Close and discard the current thread's scoped session, if any."""
+        if self.scoped_session_factory is not None:
+            self.scoped_session_factory.remove()
+    
+    def unit_of_work(self) -> UnitOfWork:
+        """
+        Create a UnitOfWork that owns a fresh, unscoped session.
+        
+        Returns:
+            UnitOfWork instance
+            
+        Example:
+            with db_manager.unit_of_work() as uow:
+                uow.get_repository(MyModel).add(entity)
+        """
+        return UnitOfWork(self.create_session())
+    
     def get_session_generator(self) -> Generator[Session, None, None]:
         """
         Get a session generator for dependency injection.
@@ -4,8 +4,8 @@ Repository pattern and Unit of Work for database operations.
 
 import logging
 from typing import TypeVar, Generic, Type, Optional, List, Any, Dict
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy.orm import Session, InstrumentedAttribute
+from sqlalchemy import desc, func, select
 
 from toolkit.core.database.models import ModelBase
 
@@ -19,6 +19,22 @@ class Repository(Generic[T]):
     Provides CRUD operations for any model type.
     """
     
+    __slots__ = ('session', 'model_class', 'logger', '_select_all', '_select_count', '_column_cache')
+    
+    # Loggers shared across instances, keyed by (repository class, model class)
+    _logger_cache: Dict[tuple, logging.Logger] = {}
+    
+    @classmethod
+    def _get_logger(cls, model_class: type) -> logging.Logger:
+        """Return the cached logger for this repository class and model."""
+        key = (cls, model_class)
+        logger = Repository._logger_cache.get(key)
+        if logger is None:
+            logger = Repository._logger_cache[key] = logging.getLogger(
+                f"{cls.__name__}[{model_class.__name__}]"
+            )
+        return logger
+    
     def __init__(self, session: Session, model_class: Type[T]):
         """
         Initialize Repository.
@@ -29,7 +45,29 @@ class Repository(Generic[T]):
         """
         self.session = session
         self.model_class = model_class
-        self.logger = logging.getLogger(f"{self.__class__.__name__}[{model_class.__name__}]")
+        self.logger = self._get_logger(model_class)
+        
+        # 2.0-style statements hit SQLAlchemy's compiled-SQL cache on reuse
+        self._select_all = select(model_class)
+        self._select_count = select(func.count()).select_from(model_class)
+        
+        # Resolved model columns, keyed by attribute name
+        self._column_cache: Dict[str, InstrumentedAttribute] = {}
+    
+    def _column(self, name: str) -> InstrumentedAttribute:
+        """
+        Resolve a model column by name, caching the descriptor lookup.
+        
+        Args:
+            name: Column attribute name
+            
+        Returns:
+            Instrumented column attribute
+        """
+        column = self._column_cache.get(name)
+        if column is None:
+            column = self._column_cache[name] = getattr(self.model_class, name)
+        return column
     
     def get_by_id(self, entity_id: Any) -> Optional[T]:
         """
@@ -41,7 +79,7 @@ class Repository(Generic[T]):
         Returns:
             Entity instance or None
         """
-        return self.session.query(self.model_class).filter_by(id=entity_id).first()
+        return self.session.get(self.model_class, entity_id)
     
     def get_all(self, limit: Optional[int] = None, offset: int = 0, order_by: Optional[str] = None) -> List[T]:
         """
@@ -55,17 +93,12 @@ class Repository(Generic[T]):
         Returns:
             List of entity instances
         """
-        query = self.session.query(self.model_class)
+        query = self._select_all
         
         if order_by:
-            if order_by.startswith('-'):
-                # Descending order
-                column = getattr(self.model_class, order_by[1:])
-                query = query.order_by(desc(column))
-            else:
-                # Ascending order
-                column = getattr(self.model_class, order_by)
-                query = query.order_by(column)
+            descending = order_by.startswith('-')
+            column = self._column(order_by.lstrip('-'))
+            query = query.order_by(desc(column) if descending else column)
         
         if offset:
             query = query.offset(offset)
@@ -73,7 +106,7 @@ class Repository(Generic[T]):
         if limit:
             query = query.limit(limit)
         
-        return query.all()
+        return list(self.session.scalars(query).all())
     
     def find_by(self, **filters: Any) -> List[T]:
         """
@@ -85,7 +118,7 @@ class Repository(Generic[T]):
         Returns:
             List of matching entity instances
         """
-        return self.session.query(self.model_class).filter_by(**filters).all()
+        return list(self.session.scalars(self._select_all.filter_by(**filters)).all())
     
     def find_one_by(self, **filters: Any) -> Optional[T]:
         """
@@ -97,7 +130,7 @@ class Repository(Generic[T]):
         Returns:
             Entity instance or None
         """
-        return self.session.query(self.model_class).filter_by(**filters).first()
+        return self.session.scalars(self._select_all.filter_by(**filters)).first()
     
     def add(self, entity: T) -> T:
         """
@@ -112,6 +145,48 @@ class Repository(Generic[T]):
         self.session.add(entity)
         return entity
     
+    def bulk_add(self, entities: List[T], batch_size: int = 1000) -> int:
+        """
+        Insert many new entities with batched INSERT statements.
+        
+        Bypasses the unit-of-work bookkeeping of add(): relationships are not
+        cascaded and the entities are not attached to the session afterwards.
+        
+        Args:
+            entities: Entity instances to insert
+            batch_size: Number of entities per INSERT batch
+            
+        Returns:
+            Number of entities inserted
+        """
+        for start in range(0, len(entities), batch_size):
+            self.session.bulk_save_objects(
+                entities[start:start + batch_size],
+                return_defaults=False
+            )
+        return len(entities)
+    
+    def bulk_update_mappings(self, mappings: List[Dict[str, Any]], batch_size: int = 1000) -> int:
+        """
+        Update many rows from dictionaries keyed by column name.
+        
+        Each mapping must include the primary key. Like bulk_add(), this skips
+        relationship cascades and does not refresh loaded entities.
+        
+        Args:
+            mappings: Column/value dictionaries including the primary key
+            batch_size: Number of mappings per UPDATE batch
+            
+        Returns:
+            Number of mappings applied
+        """
+        for start in range(0, len(mappings), batch_size):
+            self.session.bulk_update_mappings(
+                self.model_class,
+                mappings[start:start + batch_size]
+            )
+        return len(mappings)
+    
     def update(self, entity: T) -> T:
         """
         Update an entity.
@@ -160,10 +235,10 @@ class Repository(Generic[T]):
         Returns:
             Count of matching entities
         """
-        query = self.session.query(self.model_class)
+        query = self._select_count
         if filters:
             query = query.filter_by(**filters)
-        return query.count()
+        return self.session.scalar(query)
     
     def exists(self, **filters: Any) -> bool:
         """
@@ -175,7 +250,9 @@ class Repository(Generic[T]):
         Returns:
             True if exists, False otherwise
         """
-        return self.count(**filters) > 0
+        # EXISTS lets the database stop at the first matching row
+        subquery = self._select_all.filter_by(**filters).exists()
+        return bool(self.session.scalar(select(subquery)))
 
 
 class UnitOfWork:
@@ -185,6 +262,8 @@ class UnitOfWork:
     Manages transactions and provides repositories with session management.
     """
     
+    __slots__ = ('session', 'logger', '_repositories')
+    
     def __init__(self, session: Session):
         """
         Initialize UnitOfWork.
@@ -206,9 +285,10 @@ class UnitOfWork:
         Returns:
             Repository instance for the model
         """
-        if model_class not in self._repositories:
-            self._repositories[model_class] = Repository(self.session, model_class)
-        return self._repositories[model_class]
+        repository = self._repositories.get(model_class)
+        if repository is None:
+            repository = self._repositories[model_class] = Repository(self.session, model_class)
+        return repository
     
     def commit(self):
         """Commit the current transaction."""
@@ -6,7 +6,13 @@ Provides file downloading, path management, and download strategies.
 
 from toolkit.core.download.downloader import FileDownloader
 from toolkit.core.download.path_manager import StoragePathManager
-from toolkit.core.download.strategies import DownloadStrategy, HTTPDownloadStrategy
+from toolkit.core.download.strategies import (
+    DownloadStrategy,
+    HTTPDownloadStrategy,
+    AsyncDownloadStrategy,
+    AsyncHTTPDownloadStrategy,
+)
+from toolkit.core.download.strategies_http2 import HTTPXDownloadStrategy
 from toolkit.core.download.config import DownloadConfig, RetryPolicy
 from toolkit.core.download.types import ContentType
 
@@ -15,6 +21,9 @@ __all__ = [
     'StoragePathManager',
     'DownloadStrategy',
     'HTTPDownloadStrategy',
+    'AsyncDownloadStrategy',
+    'AsyncHTTPDownloadStrategy',
+    'HTTPXDownloadStrategy',
     'DownloadConfig',
     'RetryPolicy',
     'ContentType',
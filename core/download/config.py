@@ -25,6 +25,7 @@ class DownloadConfig:
     user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
     retry_policy: RetryPolicy = None
     verify_ssl: bool = True
+    pool_size: int = 64
     
     def __post_init__(self):
         """Initialize default retry policy if not provided."""
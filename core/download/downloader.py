@@ -8,8 +8,8 @@ from typing import Optional
 from pathlib import Path
 import requests
 
-from toolkit.core.download.config import DownloadConfig, RetryPolicy
-from toolkit.core.download.strategies import DownloadStrategy, HTTPDownloadStrategy
+from toolkit.core.download.config import DownloadConfig
+from toolkit.core.download.strategies import DownloadStrategy, HTTPDownloadStrategy, create_pooled_session
 
 
 class FileDownloader:
@@ -25,13 +25,21 @@ class FileDownloader:
         
         Args:
             config: DownloadConfig instance
-            strategy: DownloadStrategy instance (defaults to HTTPDownloadStrategy)
+            strategy: DownloadStrategy instance (defaults to HTTPDownloadStrategy
+                sharing this downloader's session)
         """
         self.config = config
-        self.strategy = strategy or HTTPDownloadStrategy(config)
         self.logger = logging.getLogger(self.__class__.__name__)
+        self.session = create_pooled_session(config.retry_policy, config.pool_size)
+        self.strategy = strategy or HTTPDownloadStrategy(config, self.session)
     
-    def download(self, url: str, destination: Path, session: Optional[requests.Session] = None) -> bool:
+    def download(
+        self,
+        url: str,
+        destination: Path,
+        session: Optional[requests.Session] = None,
+        chunk_size: Optional[int] = None
+    ) -> bool:
         """
         Download file with automatic retries.
         
@@ -39,6 +47,7 @@ class FileDownloader:
             url: URL to download from
             destination: Path to save file
             session: Optional requests Session
+            chunk_size: Override chunk size from config
             
         Returns:
             True if successful, False otherwise
@@ -46,24 +55,42 @@ class FileDownloader:
         retry_policy = self.config.retry_policy
         destination = Path(destination)
         
-        for attempt in range(retry_policy.max_retries):
+        # HTTP downloads on the internal session raise instead of returning
+        # False, so failures urllib3 already retried can be told apart
+        fetch = None
+        if session is None and isinstance(self.strategy, HTTPDownloadStrategy):
+            session = self.session
+            # Subclasses overriding download() (auth, validation) must go through it
+            if type(self.strategy).download is HTTPDownloadStrategy.download:
+                fetch = self.strategy.fetch
+        
+        attempt = 0
+        for attempt in range(1, retry_policy.max_retries + 1):
             try:
-                success = self.strategy.download(url, destination, session)
-                if success:
+                if fetch is not None:
+                    fetch(url, destination, session, chunk_size)
+                    return True
+                if self.strategy.download(url, destination, session, chunk_size):
                     return True
+            except requests.exceptions.RequestException as e:
+                self.logger.warning(f"Download attempt {attempt} failed: {e}")
+                if fetch is not None:
+                    # Status and connect errors were already retried by urllib3
+                    break
             except Exception as e:
-                self.logger.warning(f"Download attempt {attempt + 1} failed: {e}")
+                # Includes connections dropped mid-body and disk write errors
+                self.logger.warning(f"Download attempt {attempt} failed: {e}")
             
             # Calculate delay for next retry
-            if attempt < retry_policy.max_retries - 1:
+            if attempt < retry_policy.max_retries:
                 delay = min(
-                    retry_policy.base_delay * (retry_policy.exponential_base ** attempt),
+                    retry_policy.base_delay * (retry_policy.exponential_base ** (attempt - 1)),
                     retry_policy.max_delay
                 )
                 self.logger.info(f"Retrying in {delay:.1f}s...")
                 time.sleep(delay)
         
-        self.logger.error(f"Failed to download {url} after {retry_policy.max_retries} attempts")
+        self.logger.error(f"Failed to download {url} after {attempt} attempts")
         return False
     
     def download_stream(self, url: str, destination: Path, chunk_size: Optional[int] = None) -> bool:
@@ -78,13 +105,4 @@ class FileDownloader:
         Returns:
             True if successful, False otherwise
         """
-        # Use the configured chunk size unless overridden
-        original_chunk_size = self.config.chunk_size
-        if chunk_size:
-            self.config.chunk_size = chunk_size
-        
-        try:
-            return self.download(url, destination)
-        finally:
-            self.config.chunk_size = original_chunk_size
-
+        return self.download(url, destination, chunk_size=chunk_size)
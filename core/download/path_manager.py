@@ -5,6 +5,7 @@ Provides directory organization and path normalization utilities.
 """
 
 import logging
+import os
 from pathlib import Path
 from typing import Union, Optional
 from toolkit.core.download.types import ContentType
@@ -17,6 +18,8 @@ class StoragePathManager:
     Provides configurable path strategies for organizing downloaded content.
     """
     
+    __slots__ = ('base_dir', 'strategy', 'logger', '_base_str', '_dir_cache')
+    
     def __init__(self, base_dir: Union[str, Path], strategy: str = "source_type"):
         """
         Initialize StoragePathManager.
@@ -29,6 +32,12 @@ class StoragePathManager:
         self.strategy = strategy
         self.logger = logging.getLogger(self.__class__.__name__)
         
+        # Lowercased, forward-slash base prefix for string-based normalization
+        self._base_str = str(self.base_dir).replace('\\', '/').lower().rstrip('/') + '/'
+        
+        # Content directories already created, keyed by (source, content_type)
+        self._dir_cache: dict[tuple[str, ContentType], Path] = {}
+        
         # Create base directory
         self.base_dir.mkdir(parents=True, exist_ok=True)
     
@@ -46,6 +55,10 @@ class StoragePathManager:
         if not source or not isinstance(source, str):
             raise ValueError("Source must be a non-empty string")
         
+        cached = self._dir_cache.get((source, content_type))
+        if cached is not None:
+            return cached
+        
         if self.strategy == "flat":
             # All files in one directory
             content_dir = self.base_dir / content_type.value
@@ -57,6 +70,7 @@ class StoragePathManager:
             content_dir = self.base_dir / source / content_type.value
         
         content_dir.mkdir(parents=True, exist_ok=True)
+        self._dir_cache[(source, content_type)] = content_dir
         return content_dir
     
     def normalize_path(self, path: Union[str, Path]) -> str:
@@ -72,20 +86,20 @@ class StoragePathManager:
         if not path:
             return ""
         
-        path_obj = Path(path)
+        normalized = str(path).replace('\\', '/').lower()
+        
+        # Relative paths only need separator/case normalization
+        if not os.path.isabs(normalized):
+            return normalized
         
-        # Handle relative paths
-        if not path_obj.is_absolute():
-            normalized = str(path_obj).replace('\\', '/')
-            return normalized.lower()
+        # Absolute paths under base_dir become relative to it
+        if normalized.startswith(self._base_str):
+            return normalized[len(self._base_str):]
+        if normalized == self._base_str[:-1]:
+            return "."
         
-        # Handle absolute paths - try to make relative to base_dir
-        try:
-            relative_path = path_obj.relative_to(self.base_dir)
-            return str(relative_path).replace('\\', '/').lower()
-        except ValueError:
-            # Path is not under base_dir, return normalized absolute
-            return str(path_obj).replace('\\', '/').lower()
+        # Path is not under base_dir, return normalized absolute
+        return normalized
     
     def resolve_path(self, relative_path: str) -> Path:
         """
@@ -4,12 +4,139 @@ Download strategy implementations.
 Provides different strategies for downloading files (HTTP, FTP, etc.)
 """
 
+import asyncio
+import ctypes
+import ctypes.util
+import errno
 import logging
+import os
+import shutil
+import sys
+import threading
 import requests
 from abc import ABC, abstractmethod
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import ClassVar, Optional, Iterable
 from pathlib import Path
-from toolkit.core.download.config import DownloadConfig
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from toolkit.core.download.config import DownloadConfig, RetryPolicy
+
+# Optional async download support
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import aiofiles
+    AIOFILES_AVAILABLE = True
+except ImportError:
+    AIOFILES_AVAILABLE = False
+
+# Bulk copies read at least this much per syscall regardless of chunk_size
+_MIN_COPY_BUFFER = 1 << 20
+
+# Bodies at least this large overlap network reads with disk writes
+_PIPELINE_MIN_BYTES = 8 << 20
+
+# Filesystems that cannot preallocate report one of these; skip quietly
+_FALLOCATE_UNSUPPORTED = {errno.EOPNOTSUPP, errno.EINVAL, errno.ENOSYS}
+
+# Linux fallocate(2) avoids glibc's posix_fallocate fallback of writing zeros
+_FALLOC_FL_KEEP_SIZE = 0x01
+_libc_fallocate = None
+if sys.platform.startswith('linux'):
+    try:
+        _libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        _libc_fallocate = _libc.fallocate64
+        _libc_fallocate.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int64, ctypes.c_int64]
+        _libc_fallocate.restype = ctypes.c_int
+    except (OSError, AttributeError):
+        _libc_fallocate = None
+
+
+def _preallocate(fd: int, length: int) -> bool:
+    """
+    Reserve disk space for a file about to be written.
+    
+    Args:
+        fd: Open file descriptor
+        length: Number of bytes to reserve
+        
+    Returns:
+        True if space was reserved, False if unsupported on this platform/filesystem
+        
+    Raises:
+        OSError: If the filesystem has insufficient space (ENOSPC)
+    """
+    try:
+        if _libc_fallocate is not None:
+            if _libc_fallocate(fd, _FALLOC_FL_KEEP_SIZE, 0, length) != 0:
+                err = ctypes.get_errno()
+                raise OSError(err, os.strerror(err))
+        elif hasattr(os, 'posix_fallocate'):
+            os.posix_fallocate(fd, 0, length)
+        else:
+            return False
+    except OSError as e:
+        if e.errno in _FALLOCATE_UNSUPPORTED:
+            return False
+        raise
+    return True
+
+
+def _copy_pipelined(src, dst, length: int):
+    """
+    Copy src to dst, writing each chunk on a background thread.
+    
+    The next read from src proceeds while the previous chunk is written,
+    so network receive and disk write overlap (double buffering).
+    
+    Args:
+        src: Readable file-like object (e.g. response.raw)
+        dst: Writable file object
+        length: Read size per chunk
+    """
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="download-writer") as writer:
+        pending = None
+        while True:
+            chunk = src.read(length)
+            if not chunk:
+                break
+            if pending is not None:
+                pending.result()
+            pending = writer.submit(dst.write, chunk)
+        if pending is not None:
+            pending.result()
+
+
+def create_pooled_session(retry_policy: RetryPolicy, pool_size: int = 10) -> requests.Session:
+    """
+    Create a pooled session whose HTTP retries are handled by urllib3.
+    
+    Retries reuse the pooled connection and honor Retry-After headers.
+    
+    Args:
+        retry_policy: RetryPolicy supplying the retry count and backoff
+        pool_size: Connections kept per host
+        
+    Returns:
+        requests.Session with a retrying HTTPAdapter mounted
+    """
+    retry = Retry(
+        total=max(retry_policy.max_retries - 1, 0),
+        backoff_factor=retry_policy.backoff_factor,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        respect_retry_after_header=True
+    )
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
 
 
 class DownloadStrategy(ABC):
@@ -30,7 +157,13 @@ class DownloadStrategy(ABC):
         self.logger = logging.getLogger(self.__class__.__name__)
     
     @abstractmethod
-    def download(self, url: str, destination: Path, session: Optional[requests.Session] = None) -> bool:
+    def download(
+        self,
+        url: str,
+        destination: Path,
+        session: Optional[requests.Session] = None,
+        chunk_size: Optional[int] = None
+    ) -> bool:
         """
         Download a file from URL to destination.
         
@@ -38,6 +171,7 @@ class DownloadStrategy(ABC):
             url: URL to download from
             destination: Path to save file
             session: Optional requests Session
+            chunk_size: Override chunk size from config
             
         Returns:
             True if successful, False otherwise
@@ -48,9 +182,66 @@ class DownloadStrategy(ABC):
 class HTTPDownloadStrategy(DownloadStrategy):
     """
     HTTP/HTTPS download strategy using requests library.
+    
+    Pass the session to reuse (FileDownloader hands over its pooled,
+    retrying session) so all downloads share one connection pool. Without
+    one, the strategy creates its own pooled session on first use.
     """
     
-    def download(self, url: str, destination: Path, session: Optional[requests.Session] = None) -> bool:
+    # Parent directories already created by this process
+    _ensured_dirs: ClassVar[set] = set()
+    _ensured_lock: ClassVar[threading.Lock] = threading.Lock()
+    
+    def __init__(self, config: DownloadConfig, session: Optional[requests.Session] = None):
+        """
+        Initialize HTTPDownloadStrategy.
+        
+        Args:
+            config: DownloadConfig instance
+            session: Default requests Session for calls that do not pass one
+                (a pooled session is created lazily if omitted)
+        """
+        super().__init__(config)
+        self.session = session
+        self._session_lock = threading.Lock()
+    
+    def _get_session(self) -> requests.Session:
+        """
+        Get the default session, creating a pooled one on first use.
+        
+        Returns:
+            requests.Session instance
+        """
+        if self.session is None:
+            with self._session_lock:
+                if self.session is None:
+                    self.session = create_pooled_session(self.config.retry_policy, self.config.pool_size)
+        return self.session
+    
+    @classmethod
+    def _ensure_parent(cls, destination: Path):
+        """
+        Create the destination's parent directory once per process.
+        
+        Directories removed externally after first use are not recreated.
+        
+        Args:
+            destination: File path about to be written
+        """
+        parent = str(destination.parent)
+        if parent not in cls._ensured_dirs:
+            with cls._ensured_lock:
+                if parent not in cls._ensured_dirs:
+                    destination.parent.mkdir(parents=True, exist_ok=True)
+                    cls._ensured_dirs.add(parent)
+    
+    def download(
+        self,
+        url: str,
+        destination: Path,
+        session: Optional[requests.Session] = None,
+        chunk_size: Optional[int] = None
+    ) -> bool:
         """
         Download file via HTTP/HTTPS.
         
@@ -58,6 +249,7 @@ class HTTPDownloadStrategy(DownloadStrategy):
             url: URL to download from
             destination: Path to save file
             session: Optional requests Session
+            chunk_size: Override chunk size from config (copy buffer is at least 1 MiB)
             
         Returns:
             True if successful, False otherwise
@@ -66,59 +258,8 @@ class HTTPDownloadStrategy(DownloadStrategy):
             self.logger.error("URL must be a non-empty string")
             return False
         
-        destination = Path(destination)
-        
         try:
-            # Ensure destination directory exists
-            destination.parent.mkdir(parents=True, exist_ok=True)
-            
-            self.logger.debug(f"Downloading: {url}")
-            
-            # Prepare headers
-            headers = {
-                'User-Agent': self.config.user_agent,
-                'Accept': '*/*'
-            }
-            
-            # Make request
-            if session:
-                response = session.get(
-                    url, 
-                    headers=headers, 
-                    stream=True, 
-                    timeout=self.config.timeout,
-                    verify=self.config.verify_ssl
-                )
-            else:
-                response = requests.get(
-                    url,
-                    headers=headers,
-                    stream=True,
-                    timeout=self.config.timeout,
-                    verify=self.config.verify_ssl
-                )
-            
-            response.raise_for_status()
-            
-            # Check available disk space
-            content_length = response.headers.get('content-length')
-            if content_length:
-                required_space = int(content_length)
-                available_space = self._get_available_space(destination.parent)
-                if available_space < required_space:
-                    self.logger.error(
-                        f"Insufficient disk space. Required: {required_space}, "
-                        f"Available: {available_space}"
-                    )
-                    return False
-            
-            # Download file
-            with open(destination, "wb") as f:
-                for chunk in response.iter_content(chunk_size=self.config.chunk_size):
-                    if chunk:  # Filter out keep-alive chunks
-                        f.write(chunk)
-            
-            self.logger.info(f"Successfully downloaded {url} to {destination}")
+            self.fetch(url, destination, session, chunk_size)
             return True
             
         except requests.exceptions.RequestException as e:
@@ -131,27 +272,241 @@ class HTTPDownloadStrategy(DownloadStrategy):
             self.logger.error(f"Unexpected error downloading {url}: {e}")
             return False
     
-    def _get_available_space(self, path: Path) -> int:
+    def fetch(
+        self,
+        url: str,
+        destination: Path,
+        session: Optional[requests.Session] = None,
+        chunk_size: Optional[int] = None
+    ):
         """
-        Get available disk space in bytes.
+        Download file via HTTP/HTTPS, raising on failure.
         
         Args:
-            path: Path to check disk space for
+            url: URL to download from
+            destination: Path to save file
+            session: Optional requests Session
+            chunk_size: Override chunk size from config (copy buffer is at least 1 MiB)
+            
+        Raises:
+            requests.exceptions.RequestException: If the request or response status fails
+            urllib3.exceptions.HTTPError: If the connection breaks while streaming the body
+            OSError: If the file cannot be written
+        """
+        destination = Path(destination)
+        
+        # Ensure destination directory exists
+        self._ensure_parent(destination)
+        
+        self.logger.debug("Downloading: %s", url)
+        
+        # Prepare headers
+        headers = {
+            'User-Agent': self.config.user_agent,
+            'Accept': '*/*'
+        }
+        
+        # Make request
+        session = session or self._get_session()
+        response = session.get(
+            url,
+            headers=headers,
+            stream=True,
+            timeout=self.config.timeout,
+            verify=self.config.verify_ssl
+        )
+        
+        response.raise_for_status()
+        
+        # Download file
+        # Let urllib3 decode and copy straight into the file in C
+        response.raw.decode_content = True
+        content_length = response.headers.get('content-length')
+        with open(destination, "wb", buffering=0) as f:
+            # Reserve contiguous space up front; fails fast with ENOSPC
+            preallocated = bool(content_length) and _preallocate(f.fileno(), int(content_length))
+            buffer_size = max(chunk_size or self.config.chunk_size, _MIN_COPY_BUFFER)
+            if content_length and int(content_length) >= _PIPELINE_MIN_BYTES:
+                _copy_pipelined(response.raw, f, buffer_size)
+            else:
+                shutil.copyfileobj(response.raw, f, length=buffer_size)
+            if preallocated:
+                # Release any reserved space beyond what was written
+                f.truncate()
+        
+        self.logger.info(f"Successfully downloaded {url} to {destination}")
+
+
+class AsyncDownloadStrategy(ABC):
+    """
+    Abstract base class for asyncio-based download strategies.
+    
+    Kept separate from DownloadStrategy so coroutine-returning strategies
+    are never handed to the synchronous FileDownloader retry loop.
+    """
+    
+    def __init__(self, config: DownloadConfig):
+        """
+        Initialize async download strategy.
+        
+        Args:
+            config: DownloadConfig instance
+        """
+        self.config = config
+        self.logger = logging.getLogger(self.__class__.__name__)
+    
+    @abstractmethod
+    async def download(self, url: str, destination: Path, session=None, chunk_size: Optional[int] = None) -> bool:
+        """
+        Download a file from URL to destination.
+        
+        Args:
+            url: URL to download from
+            destination: Path to save file
+            session: Optional strategy-specific client session
+            chunk_size: Override chunk size from config
             
         Returns:
-            Available space in bytes, or float('inf') if unable to determine
+            True if successful, False otherwise
         """
-        try:
-            import os
-            statvfs = os.statvfs(str(path))
-            return statvfs.f_frsize * statvfs.f_bavail
-        except (OSError, AttributeError):
-            # Windows doesn't have statvfs
-            try:
-                import shutil
-                total, used, free = shutil.disk_usage(str(path))
-                return free
-            except Exception:
-                # Fallback: assume we have enough space
-                return float('inf')
+        pass
+    
+    @abstractmethod
+    async def download_many(self, items: Iterable[tuple[str, Path]], limit: int = 64) -> list[bool]:
+        """
+        Download many files concurrently over one shared client session.
+        
+        Args:
+            items: (url, destination) pairs
+            limit: Maximum number of concurrent connections
+            
+        Returns:
+            Success flag per item, in input order
+        """
+        pass
+
 
+class AsyncHTTPDownloadStrategy(AsyncDownloadStrategy):
+    """
+    HTTP/HTTPS download strategy using aiohttp.
+    
+    Many downloads multiplex onto one event loop thread and share the
+    connection pool and DNS cache of a single ClientSession.
+    """
+    
+    def __init__(self, config: DownloadConfig):
+        """
+        Initialize AsyncHTTPDownloadStrategy.
+        
+        Args:
+            config: DownloadConfig instance
+            
+        Raises:
+            ImportError: If aiohttp is not installed
+        """
+        if not AIOHTTP_AVAILABLE:
+            raise ImportError("aiohttp is required for AsyncHTTPDownloadStrategy")
+        super().__init__(config)
+    
+    def create_session(self, limit: int = 64) -> "aiohttp.ClientSession":
+        """
+        Create a pooled ClientSession suitable for sharing across downloads.
+        
+        Args:
+            limit: Maximum number of concurrent connections
+            
+        Returns:
+            aiohttp.ClientSession instance (caller must close it)
+        """
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=limit, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=self.config.timeout),
+            headers={'User-Agent': self.config.user_agent, 'Accept': '*/*'}
+        )
+    
+    async def download(
+        self,
+        url: str,
+        destination: Path,
+        session: Optional["aiohttp.ClientSession"] = None,
+        chunk_size: Optional[int] = None
+    ) -> bool:
+        """
+        Download file via HTTP/HTTPS.
+        
+        Args:
+            url: URL to download from
+            destination: Path to save file
+            session: Optional shared aiohttp.ClientSession
+            chunk_size: Override chunk size from config
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        if not url or not isinstance(url, str):
+            self.logger.error("URL must be a non-empty string")
+            return False
+        
+        if session is None:
+            async with self.create_session() as owned_session:
+                return await self._download(url, Path(destination), owned_session, chunk_size)
+        
+        return await self._download(url, Path(destination), session, chunk_size)
+    
+    async def download_many(self, items: Iterable[tuple[str, Path]], limit: int = 64) -> list[bool]:
+        """
+        Download many files concurrently over one shared ClientSession.
+        
+        Args:
+            items: (url, destination) pairs
+            limit: Maximum number of concurrent connections
+            
+        Returns:
+            Success flag per item, in input order
+        """
+        async with self.create_session(limit) as session:
+            return list(await asyncio.gather(
+                *(self.download(url, destination, session) for url, destination in items)
+            ))
+    
+    async def _download(
+        self,
+        url: str,
+        destination: Path,
+        session: "aiohttp.ClientSession",
+        chunk_size: Optional[int]
+    ) -> bool:
+        """Stream a single response body to disk."""
+        chunk_size = chunk_size or self.config.chunk_size
+        
+        try:
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            
+            self.logger.debug("Downloading: %s", url)
+            
+            ssl = None if self.config.verify_ssl else False
+            async with session.get(url, ssl=ssl) as response:
+                response.raise_for_status()
+                
+                if AIOFILES_AVAILABLE:
+                    async with aiofiles.open(destination, "wb") as f:
+                        async for chunk in response.content.iter_chunked(chunk_size):
+                            await f.write(chunk)
+                else:
+                    # Keep blocking disk writes off the event loop
+                    with open(destination, "wb") as f:
+                        async for chunk in response.content.iter_chunked(chunk_size):
+                            await asyncio.to_thread(f.write, chunk)
+            
+            self.logger.info(f"Successfully downloaded {url} to {destination}")
+            return True
+            
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.logger.error(f"Failed to download {url}: {e}")
+            return False
+        except OSError as e:
+            self.logger.error(f"Failed to save file to {destination}: {e}")
+            return False
+        except Exception as e:
+            self.logger.error(f"Unexpected error downloading {url}: {e}")
+            return False
@@ -17,7 +17,7 @@ class LogLevel(Enum):
     CRITICAL = "CRITICAL"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HandlerConfig:
     """Configuration for a logging handler."""
     
@@ -34,9 +34,11 @@ class HandlerConfig:
     # Database handler specific
     db_connection_string: Optional[str] = None
     table_name: str = "logs"
+    queue_size: int = 10000  # Max records buffered between logger and DB writer
+    batch_size: int = 500  # Records per batched insert
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LogConfig:
     """Complete logging configuration."""
     
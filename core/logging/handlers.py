@@ -3,9 +3,13 @@ Custom logging handlers and formatters.
 """
 
 import logging
+import threading
+import time
+import traceback
 from logging import handlers
 from datetime import datetime, timezone
-from typing import Optional, Any
+from typing import Any
+from sqlalchemy import column, insert, table
 from toolkit.core.logging.session import SessionTracker
 
 
@@ -14,24 +18,14 @@ class UTCFormatter(logging.Formatter):
     Custom formatter that converts timestamps to UTC.
     
     Useful for distributed systems where consistent timezone handling is important.
+    Timestamps are rendered by the base Formatter via time.gmtime/strftime,
+    e.g. '2024-01-01 12:00:00 UTC'.
     """
     
-    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
-        """
-        Format time in UTC.
-        
-        Args:
-            record: Log record
-            datefmt: Optional date format string
-            
-        Returns:
-            Formatted UTC timestamp string
-        """
-        ct = datetime.fromtimestamp(record.created, tz=timezone.utc)
-        if datefmt:
-            return ct.strftime(datefmt)
-        else:
-            return ct.strftime('%Y-%m-%d %H:%M:%S UTC')
+    converter = staticmethod(time.gmtime)
+    default_time_format = '%Y-%m-%d %H:%M:%S UTC'
+    # No ",mmm" suffix, matching the previous output
+    default_msec_format = None
 
 
 class DatabaseHandler(logging.Handler):
@@ -40,19 +34,39 @@ class DatabaseHandler(logging.Handler):
     
     Requires a database session/connection to be provided. The database
     should have a logs table with appropriate schema.
+    
+    Records are buffered and written in batches (one executemany INSERT and
+    commit per batch) once batch_size entries have accumulated or max_wait
+    seconds have passed, checked on emit and by a background flush thread.
+    Intended to run behind a QueueListener so producers never block on I/O.
     """
     
-    def __init__(self, db_session, table_name: str = "logs"):
+    _COLUMNS = ('level', 'message', 'source', 'session_id', 'entity_id', 'timestamp')
+    
+    def __init__(self, db_session, table_name: str = "logs", batch_size: int = 500, max_wait: float = 1.0):
         """
         Initialize DatabaseHandler.
         
         Args:
             db_session: Database session (SQLAlchemy Session or similar)
             table_name: Name of the logs table
+            batch_size: Number of buffered entries that triggers a write
+            max_wait: Maximum seconds an entry stays buffered
         """
         super().__init__()
         self.db_session = db_session
         self.table_name = table_name
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self._buffer: list = []
+        self._last_flush = time.monotonic()
+        # Serializes writes: the session is shared by emit and the flusher
+        self._write_lock = threading.Lock()
+        self._insert_stmt = insert(table(table_name, *(column(name) for name in self._COLUMNS)))
+        
+        self._stop_flusher = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically, name="db-log-flusher", daemon=True)
+        self._flusher.start()
     
     def emit(self, record: logging.LogRecord):
         """
@@ -78,15 +92,83 @@ class DatabaseHandler(logging.Handler):
                 'timestamp': datetime.now(timezone.utc)
             }
             
-            # Insert into database
-            # This is a generic interface - users must implement their own
-            # Log model or provide a custom emit method
-            self._insert_log(log_entry)
+            # Same lock flush() swaps the buffer under, whoever calls emit
+            self.acquire()
+            try:
+                self._buffer.append(log_entry)
+                full = len(self._buffer) >= self.batch_size
+            finally:
+                self.release()
+            
+            if full:
+                self.flush()
+            else:
+                self._maybe_flush()
             
         except Exception:
             # Don't let logging errors break the application
             self.handleError(record)
     
+    def _maybe_flush(self):
+        """Flush if the oldest buffered entry may have waited max_wait."""
+        if self._buffer and time.monotonic() - self._last_flush >= self.max_wait:
+            self.flush()
+    
+    def _flush_periodically(self):
+        """Background loop bounding how long entries stay buffered."""
+        while not self._stop_flusher.wait(self.max_wait / 2):
+            self._maybe_flush()
+    
+    def flush(self):
+        """Write all buffered log entries to the database."""
+        self.acquire()
+        try:
+            entries, self._buffer = self._buffer, []
+            self._last_flush = time.monotonic()
+        finally:
+            self.release()
+        
+        if not entries:
+            return
+        
+        try:
+            with self._write_lock:
+                self._insert_logs(entries)
+        except Exception:
+            # Same policy as Handler.handleError, without a record to report
+            if logging.raiseExceptions:
+                traceback.print_exc()
+    
+    def close(self):
+        """Stop the flush thread, flush remaining entries and close the handler."""
+        self._stop_flusher.set()
+        self._flusher.join()
+        self.flush()
+        super().close()
+    
+    def _insert_logs(self, log_entries: list):
+        """
+        Insert a batch of log entries into database.
+        
+        With an SQLAlchemy session, issues a single executemany INSERT into
+        table_name and commits once. Without one, falls back to a per-entry
+        _insert_log call so custom adapters keep working.
+        
+        Args:
+            log_entries: List of log entry dictionaries
+        """
+        if self.db_session is None:
+            for log_entry in log_entries:
+                self._insert_log(log_entry)
+            return
+        
+        try:
+            self.db_session.execute(self._insert_stmt, log_entries)
+            self.db_session.commit()
+        except Exception:
+            self.db_session.rollback()
+            raise
+    
     def _insert_log(self, log_entry: dict):
         """
         Insert log entry into database.
@@ -2,8 +2,12 @@
 Logging manager for centralized logging configuration.
 """
 
+import atexit
 import logging
-import uuid
+import os
+import queue
+from contextvars import ContextVar, Token
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional, Dict, Any
 from pathlib import Path
 
@@ -12,6 +16,54 @@ from toolkit.core.logging.handlers import UTCFormatter, DatabaseHandler
 from toolkit.core.logging.session import SessionTracker
 
 
+# Ambient per-thread/per-task log context (e.g. {'entity_id': '123'})
+_log_context: ContextVar[Dict[str, Any]] = ContextVar('log_context', default={})
+
+
+class _ContextFilter(logging.Filter):
+    """
+    Attaches the manager's base context plus the ambient context to records.
+    
+    Context passed explicitly via extra={'context': ...} takes precedence.
+    """
+    
+    def __init__(self, base_ctx: Dict[str, Any]):
+        super().__init__()
+        self.base_ctx = base_ctx
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        ambient = _log_context.get()
+        explicit = record.__dict__.get('context')
+        if ambient or explicit:
+            record.context = {**self.base_ctx, **ambient, **(explicit or {})}
+        else:
+            record.context = self.base_ctx
+        return True
+
+
+class _ListenerQueueHandler(QueueHandler):
+    """
+    QueueHandler that owns the QueueListener draining its queue.
+    
+    Closing it (e.g. when the logger's handlers are cleared) stops the
+    listener thread and closes the handlers behind it.
+    """
+    
+    def __init__(self, log_queue: queue.Queue, *handlers: logging.Handler):
+        super().__init__(log_queue)
+        self.listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        self.listener.start()
+    
+    def close(self):
+        # Writes queued records before the target handlers are closed
+        if self.listener is not None:
+            self.listener.stop()
+            for handler in self.listener.handlers:
+                handler.close()
+            self.listener = None
+        super().close()
+
+
 class LoggingManager:
     """
     Manages logging configuration and loggers.
@@ -32,21 +84,39 @@ class LoggingManager:
         self.logger.setLevel(config.level.value)
         
         # Generate session ID if not provided
-        self.session_id = config.session_id or str(uuid.uuid4())
+        self.session_id = config.session_id or os.urandom(16).hex()
         
         # Initialize session tracker if enabled
         self.session_tracker: Optional[SessionTracker] = None
         if config.enable_context:
             self.session_tracker = SessionTracker(self.session_id)
         
-        # Remove existing handlers to avoid duplicates
-        self.logger.handlers.clear()
+        # Fixed per-manager state for log(): level dispatch and base context
+        self._dispatch = {
+            'debug': self.logger.debug,
+            'info': self.logger.info,
+            'warning': self.logger.warning,
+            'error': self.logger.error,
+            'critical': self.logger.critical
+        }
+        self._base_ctx = {'session_id': self.session_id} if config.enable_context else {}
         
         # Setup configured handlers
         self._setup_handlers()
+        
+        # Stop background listener/flusher threads if close() is never called
+        atexit.register(self.close)
     
     def _setup_handlers(self):
         """Setup all configured logging handlers."""
+        # Remove existing handlers to avoid duplicates
+        self._clear_handlers()
+        
+        # Attach session and ambient context to every record from this logger
+        for existing in [f for f in self.logger.filters if isinstance(f, _ContextFilter)]:
+            self.logger.removeFilter(existing)
+        self.logger.addFilter(_ContextFilter(self._base_ctx))
+        
         # If no handlers configured, setup default console handler
         if not self.config.handlers:
             self._setup_console_handler()
@@ -95,7 +165,12 @@ class LoggingManager:
         self.logger.addHandler(handler)
     
     def _setup_database_handler(self, config: HandlerConfig):
-        """Setup database handler."""
+        """
+        Setup database handler.
+        
+        The logger only enqueues records; a QueueListener thread drains the
+        queue into the DatabaseHandler, which writes them in batches.
+        """
         if not config.db_connection_string:
             self.logger.warning("Database handler enabled but no db_connection_string specified")
             return
@@ -103,11 +178,14 @@ class LoggingManager:
         # Users must provide their own database session
         # This is a placeholder for the interface
         # In practice, users would pass their database session here
-        handler = DatabaseHandler(None, config.table_name)
+        handler = DatabaseHandler(None, config.table_name, batch_size=config.batch_size)
         handler.setLevel(config.level.value)
         formatter = UTCFormatter(self.config.format_string)
         handler.setFormatter(formatter)
-        self.logger.addHandler(handler)
+        
+        queue_handler = _ListenerQueueHandler(queue.Queue(maxsize=config.queue_size), handler)
+        queue_handler.setLevel(config.level.value)
+        self.logger.addHandler(queue_handler)
     
     def get_logger(self) -> logging.Logger:
         """
@@ -122,30 +200,67 @@ class LoggingManager:
         """
         Log a message with optional context.
         
+        Session and ambient context (see set_context) are attached by a
+        logger filter; context given here is merged on top for this call.
+        
         Args:
             message: Log message
             level: Log level ('debug', 'info', 'warning', 'error', 'critical')
             context: Optional context dictionary (e.g., {'entity_id': '123'})
         """
-        # Add session context
-        if self.config.enable_context:
-            extra = {'context': {'session_id': self.session_id}}
-            if context:
-                extra['context'].update(context)
+        level = level.lower()
+        if level == 'debug' and not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        
+        method = self._dispatch.get(level, self.logger.info)
+        if context:
+            method(message, extra={'context': context})
         else:
-            extra = {'context': context or {}}
+            method(message)
+    
+    @staticmethod
+    def set_context(**context: Any) -> Token:
+        """
+        Merge values into the ambient log context for the current thread/task.
         
-        # Map level string to logging method
-        level_methods = {
-            'debug': self.logger.debug,
-            'info': self.logger.info,
-            'warning': self.logger.warning,
-            'error': self.logger.error,
-            'critical': self.logger.critical
-        }
+        Args:
+            **context: Context values (e.g., entity_id='123')
+            
+        Returns:
+            Token to pass to reset_context() to restore the previous context
+        """
+        return _log_context.set({**_log_context.get(), **context})
+    
+    @staticmethod
+    def reset_context(token: Token):
+        """
+        Restore the ambient log context saved by set_context().
         
-        method = level_methods.get(level.lower(), self.logger.info)
-        method(message, extra=extra)
+        Args:
+            token: Token returned by set_context()
+        """
+        _log_context.reset(token)
+    
+    def close(self):
+        """
+        Stop background listeners and flush/close all handlers.
+        
+        Pending queued records are written before this returns. Also runs
+        at interpreter exit.
+        """
+        atexit.unregister(self.close)
+        self._clear_handlers()
+    
+    def _clear_handlers(self):
+        """
+        Close and remove every handler on the logger.
+        
+        Handlers may have been installed by an earlier manager for the same
+        logger name; closing them stops its listener and flusher threads.
+        """
+        for handler in self.logger.handlers[:]:
+            self.logger.removeHandler(handler)
+            handler.close()
     
     def get_session_id(self) -> str:
         """
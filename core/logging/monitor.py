@@ -2,31 +2,101 @@
 Performance monitoring and metrics tracking.
 """
 
+import math
 import time
 import logging
-from typing import Dict, Any, Optional
+from array import array
+from collections import Counter
+from typing import Dict, Any, Optional, Sequence, Tuple
 from contextlib import contextmanager
 from datetime import datetime, timezone
 
+# Optional NumPy-backed sample buffers
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+_NS_PER_S = 1_000_000_000
+
+
+class _RingStat:
+    """
+    Running aggregates plus a fixed-size ring buffer of recent samples.
+    
+    Samples are integer nanoseconds. count/total/min/max/mean/m2 cover every
+    recorded sample and update in O(1) (Welford's algorithm for the
+    variance); the buffer keeps only the most recent `capacity` samples for
+    distribution queries. Values are converted to seconds only on read.
+    """
+    
+    __slots__ = ('buf', 'capacity', 'pos', 'count', 'total', 'min', 'max', 'mean', 'm2')
+    
+    def __init__(self, capacity: int):
+        self.buf = np.zeros(capacity, dtype=np.int64) if NUMPY_AVAILABLE else array('q', bytes(8 * capacity))
+        self.capacity = capacity
+        self.pos = 0
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+        self.mean = 0.0
+        self.m2 = 0.0
+    
+    def add(self, value: int):
+        """Record one sample in nanoseconds."""
+        self.buf[self.pos] = value
+        self.pos = (self.pos + 1) % self.capacity
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+    
+    def samples(self):
+        """Return the buffered samples in nanoseconds (order not preserved once wrapped)."""
+        return self.buf[:min(self.count, self.capacity)]
+    
+    def stats(self) -> Dict[str, float]:
+        """Return the running aggregates in seconds."""
+        return {
+            'count': self.count,
+            'total': self.total / _NS_PER_S,
+            'mean': self.mean / _NS_PER_S,
+            'min': self.min / _NS_PER_S,
+            'max': self.max / _NS_PER_S,
+            'std': math.sqrt(self.m2 / self.count) / _NS_PER_S
+        }
+
 
 class PerformanceMonitor:
     """
     Monitors performance metrics during scraping operations.
     
     Tracks timing, success/failure rates, and custom metrics.
+    Timing statistics are maintained incrementally, so querying them costs
+    O(1) regardless of how many samples were recorded.
     """
     
-    def __init__(self, logger: Optional[logging.Logger] = None):
+    def __init__(self, logger: Optional[logging.Logger] = None, timing_capacity: int = 10000):
         """
         Initialize PerformanceMonitor.
         
         Args:
             logger: Optional logger for performance logs
+            timing_capacity: Number of recent samples kept per operation
         """
         self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.timing_capacity = timing_capacity
         self.metrics: Dict[str, Any] = {}
-        self.timings: Dict[str, list] = {}
-        self.counters: Dict[str, int] = {}
+        self.timings: Dict[str, _RingStat] = {}
+        self.counters: Counter = Counter()
     
     @contextmanager
     def time_operation(self, operation_name: str):
@@ -40,15 +110,13 @@ class PerformanceMonitor:
             with monitor.time_operation("download"):
                 download_file(url)
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         try:
             yield
         finally:
-            duration = time.time() - start_time
-            if operation_name not in self.timings:
-                self.timings[operation_name] = []
-            self.timings[operation_name].append(duration)
-            self.logger.debug(f"Operation '{operation_name}' took {duration:.2f}s")
+            duration_ns = time.perf_counter_ns() - start_ns
+            self.record_timing_ns(operation_name, duration_ns)
+            self.logger.debug("Operation '%s' took %.2fs", operation_name, duration_ns / _NS_PER_S)
     
     def record_timing(self, operation_name: str, duration: float):
         """
@@ -58,9 +126,20 @@ class PerformanceMonitor:
             operation_name: Name of the operation
             duration: Duration in seconds
         """
-        if operation_name not in self.timings:
-            self.timings[operation_name] = []
-        self.timings[operation_name].append(duration)
+        self.record_timing_ns(operation_name, round(duration * _NS_PER_S))
+    
+    def record_timing_ns(self, operation_name: str, duration_ns: int):
+        """
+        Record a timing measurement in integer nanoseconds.
+        
+        Args:
+            operation_name: Name of the operation
+            duration_ns: Duration in nanoseconds (e.g. from time.perf_counter_ns)
+        """
+        ring = self.timings.get(operation_name)
+        if ring is None:
+            ring = self.timings[operation_name] = _RingStat(self.timing_capacity)
+        ring.add(duration_ns)
     
     def increment_counter(self, counter_name: str, amount: int = 1):
         """
@@ -70,7 +149,7 @@ class PerformanceMonitor:
             counter_name: Name of the counter
             amount: Amount to increment by
         """
-        self.counters[counter_name] = self.counters.get(counter_name, 0) + amount
+        self.counters[counter_name] += amount
     
     def set_metric(self, metric_name: str, value: Any):
         """
@@ -103,19 +182,69 @@ class PerformanceMonitor:
             operation_name: Name of the operation
             
         Returns:
-            Dictionary with min, max, mean, total, count
+            Dictionary with min, max, mean, total, count, std
         """
-        if operation_name not in self.timings or not self.timings[operation_name]:
+        ring = self.timings.get(operation_name)
+        if ring is None:
             return {}
+        return ring.stats()
+    
+    def get_percentiles(
+        self,
+        operation_name: str,
+        pcts: Sequence[float] = (50, 95, 99)
+    ) -> Dict[float, float]:
+        """
+        Get timing percentiles over the buffered recent samples.
         
-        timings = self.timings[operation_name]
-        return {
-            'count': len(timings),
-            'total': sum(timings),
-            'mean': sum(timings) / len(timings),
-            'min': min(timings),
-            'max': max(timings)
-        }
+        Args:
+            operation_name: Name of the operation
+            pcts: Percentiles to compute (0-100)
+            
+        Returns:
+            Dictionary mapping each percentile to a duration in seconds
+        """
+        ring = self.timings.get(operation_name)
+        if ring is None:
+            return {}
+        
+        samples = ring.samples()
+        if NUMPY_AVAILABLE:
+            values = np.percentile(samples, pcts) / _NS_PER_S
+            return dict(zip(pcts, values.tolist()))
+        
+        # Linear interpolation, same as NumPy's default method
+        ordered = sorted(samples)
+        last = len(ordered) - 1
+        result = {}
+        for pct in pcts:
+            rank = pct / 100 * last
+            low = int(rank)
+            high = min(low + 1, last)
+            value = ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+            result[pct] = value / _NS_PER_S
+        return result
+    
+    def get_histogram(self, operation_name: str, bins: int = 20) -> Tuple[Any, Any]:
+        """
+        Get a histogram of the buffered recent samples.
+        
+        Args:
+            operation_name: Name of the operation
+            bins: Number of equal-width bins
+            
+        Returns:
+            (counts, bin_edges) NumPy arrays, edges in seconds
+            
+        Raises:
+            ImportError: If NumPy is not installed
+            KeyError: If no timings were recorded for operation_name
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("numpy is required for get_histogram")
+        
+        counts, edges = np.histogram(self.timings[operation_name].samples(), bins=bins)
+        return counts, edges / _NS_PER_S
     
     def get_summary(self) -> Dict[str, Any]:
         """
@@ -132,7 +261,7 @@ class PerformanceMonitor:
         return {
             'metrics': self.metrics.copy(),
             'timings': timing_summaries,
-            'counters': self.counters.copy()
+            'counters': dict(self.counters)
         }
     
     def reset(self):
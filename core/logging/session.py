@@ -2,7 +2,9 @@
 Session tracking for logging and monitoring.
 """
 
-import uuid
+import os
+import time
+from collections import Counter
 from typing import Optional, Dict, Any
 from datetime import datetime, timezone
 
@@ -21,10 +23,13 @@ class SessionTracker:
         Args:
             session_id: Optional session ID (generated if not provided)
         """
-        self.session_id = session_id or str(uuid.uuid4())
+        self.session_id = session_id or os.urandom(16).hex()
+        # Wall-clock start, informational only (reported by get_summary)
         self.start_time = datetime.now(timezone.utc)
+        # Monotonic start used for duration measurement
+        self._start_perf = time.perf_counter()
         self.metadata: Dict[str, Any] = {}
-        self.stats: Dict[str, int] = {}
+        self.stats: Counter = Counter()
     
     def add_metadata(self, key: str, value: Any):
         """
@@ -57,7 +62,7 @@ class SessionTracker:
             stat_name: Name of the statistic
             amount: Amount to increment by
         """
-        self.stats[stat_name] = self.stats.get(stat_name, 0) + amount
+        self.stats[stat_name] += amount
     
     def get_stat(self, stat_name: str, default: int = 0) -> int:
         """
@@ -79,8 +84,7 @@ class SessionTracker:
         Returns:
             Duration in seconds
         """
-        duration = datetime.now(timezone.utc) - self.start_time
-        return duration.total_seconds()
+        return time.perf_counter() - self._start_perf
     
     def get_summary(self) -> Dict[str, Any]:
         """
@@ -94,6 +98,6 @@ class SessionTracker:
             'start_time': self.start_time.isoformat(),
             'duration_seconds': self.get_duration(),
             'metadata': self.metadata.copy(),
-            'stats': self.stats.copy()
+            'stats': dict(self.stats)
         }
 
@@ -6,9 +6,11 @@ Provides base classes and utilities for building website-specific scrapers.
 
 from toolkit.handlers.base import AbstractHandler
 from toolkit.handlers.utils import URLValidator, NameValidator
+from toolkit.handlers.async_adapter import AsyncHandlerAdapter
 
 __all__ = [
     'AbstractHandler',
+    'AsyncHandlerAdapter',
     'URLValidator',
     'NameValidator',
 ]
@@ -0,0 +1,105 @@
+"""
+Asyncio adapter for blocking handlers.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional
+
+from bs4 import BeautifulSoup
+
+from toolkit.handlers.base import AbstractHandler
+from toolkit.pipeline.item import ScrapedItem
+
+
+class AsyncHandlerAdapter:
+    """
+    Exposes an AbstractHandler's blocking WebDriver operations as coroutines.
+    
+    Each adapter runs its handler's calls on one dedicated thread, because a
+    WebDriver session is not safe to drive from several threads at once.
+    Running several adapters (one per browser/source) on the same event
+    loop overlaps their navigation, scrolling and parsing.
+    
+    Example:
+        adapters = [AsyncHandlerAdapter(h) for h in handlers]
+        results = await asyncio.gather(*(a.scrape_main_page() for a in adapters))
+    """
+    
+    def __init__(self, handler: AbstractHandler):
+        """
+        Initialize AsyncHandlerAdapter.
+        
+        Args:
+            handler: Handler whose driver operations should run off the event loop
+        """
+        self.handler = handler
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"handler-{handler.source_name}")
+    
+    async def __aenter__(self) -> "AsyncHandlerAdapter":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a blocking callable on the handler's thread.
+        
+        Args:
+            func: Callable to run (typically a handler or driver method)
+            *args: Positional arguments for func
+        
+        Returns:
+            The callable's return value
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+    
+    async def get_url(self, url: str, wait_for_load: bool = True):
+        """
+        Navigate to a URL.
+        
+        Args:
+            url: URL to navigate to
+            wait_for_load: Whether to wait for page load
+        """
+        await self.run(self.handler.get_url, url, wait_for_load)
+    
+    async def get_soup(self, html: Optional[str] = None) -> BeautifulSoup:
+        """
+        Get BeautifulSoup object for current page.
+        
+        Args:
+            html: Page HTML already fetched; read from the driver if omitted
+        
+        Returns:
+            BeautifulSoup instance
+        """
+        return await self.run(self.handler.get_soup, html)
+    
+    async def scroll_down(self, pixels: int = 500, scroll_timeout: float = 2.0) -> bool:
+        """
+        Scroll down the page and wait for lazily loaded content.
+        
+        Args:
+            pixels: Number of pixels to scroll
+            scroll_timeout: Maximum seconds to wait for new content
+        
+        Returns:
+            True if more content is available below the viewport
+        """
+        return await self.run(self.handler.scroll_down, pixels, scroll_timeout)
+    
+    async def scrape_main_page(self) -> List[ScrapedItem]:
+        """
+        Run the handler's scrape_main_page to completion.
+        
+        Returns:
+            List of scraped items
+        """
+        return await self.run(lambda: list(self.handler.scrape_main_page()))
+    
+    def close(self):
+        """Wait for pending handler calls and stop the handler thread."""
+        self._executor.shutdown(wait=True)
@@ -2,10 +2,10 @@
 Base handler class for website-specific scrapers.
 """
 
-import time
 import logging
 from abc import ABC, abstractmethod
-from typing import Iterator, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterator, List, Optional
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -13,7 +13,45 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from bs4 import BeautifulSoup
 
+from toolkit.core.browser.session import BrowserSession
 from toolkit.pipeline.item import ScrapedItem
+from toolkit.handlers.utils import _cached_urlparse, _compile_xpath
+
+# Optional C-backed HTML parsing
+try:
+    import lxml.html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# libxml2 tree builder when available, pure-Python parser otherwise
+_SOUP_PARSER = 'lxml' if LXML_AVAILABLE else 'html.parser'
+
+# Scrolls by arguments[0] pixels and returns the page height before scrolling
+_SCROLL_SCRIPT = """
+var height = document.body.scrollHeight;
+window.scrollBy(0, arguments[0]);
+return height;
+"""
+
+# Collects several pieces of page state in a single WebDriver round-trip
+_BULK_PROBE_SCRIPT = """
+var selectors = arguments[0];
+var complete = document.readyState === 'complete';
+return {
+    readyState: document.readyState,
+    scrollHeight: document.body ? document.body.scrollHeight : 0,
+    viewportBottom: window.innerHeight + window.scrollY,
+    matches: selectors.map(function (s) { return document.querySelector(s) !== null; }),
+    html: arguments[1] && complete ? document.documentElement.outerHTML : null
+};
+"""
+
+
+def _write_text(filename: str, content: str):
+    """Write text to a UTF-8 file (runs on the save_page_html thread)."""
+    with open(filename, 'w', encoding='utf-8') as f:
+        f.write(content)
 
 
 class AbstractHandler(ABC):
@@ -24,18 +62,23 @@ class AbstractHandler(ABC):
     for site-specific scrapers.
     """
     
-    def __init__(self, driver: WebDriver, source_name: str):
+    def __init__(self, driver: WebDriver, source_name: str, browser_session: Optional[BrowserSession] = None):
         """
         Initialize AbstractHandler.
         
         Args:
             driver: Selenium WebDriver instance
             source_name: Source identifier (e.g., 'site1', 'scraper_name')
+            browser_session: BrowserSession wrapping driver; get_url() then
+                navigates through it so its cached download cookies are re-read
         """
         self.driver = driver
         self.source_name = source_name
+        self.browser_session = browser_session
         self.logger = logging.getLogger(f"{self.__class__.__name__}:{source_name}")
         self.cookie_accepted = False
+        # Background writer for save_page_html, created on first use
+        self._save_pool: Optional[ThreadPoolExecutor] = None
     
     @abstractmethod
     def scrape_main_page(self) -> Iterator[ScrapedItem]:
@@ -59,20 +102,138 @@ class AbstractHandler(ABC):
         """
         try:
             self.logger.debug(f"Navigating to URL: {url}")
-            self.driver.get(url)
+            if self.browser_session is not None:
+                self.browser_session.navigate(url)
+            else:
+                self.driver.get(url)
             if wait_for_load:
                 self.wait_page_load()
         except Exception as e:
             self.logger.error(f"Error navigating to URL {url}: {e}", exc_info=True)
     
-    def get_soup(self) -> BeautifulSoup:
+    def get_soup(self, html: Optional[str] = None) -> BeautifulSoup:
         """
         Get BeautifulSoup object for current page.
         
+        Args:
+            html: Page HTML already fetched (e.g. by wait_page_load); read from the driver if omitted
+            
         Returns:
             BeautifulSoup instance
         """
-        return BeautifulSoup(self.driver.page_source, 'html.parser')
+        return BeautifulSoup(html if html is not None else self.driver.page_source, _SOUP_PARSER)
+    
+    def get_lxml_tree(self, html: Optional[str] = None) -> "lxml.html.HtmlElement":
+        """
+        Get lxml element tree for current page.
+        
+        Cheaper than get_soup() when the page is only queried with XPath.
+        
+        Args:
+            html: Page HTML already fetched (e.g. by wait_page_load); read from the driver if omitted
+            
+        Returns:
+            Root lxml.html.HtmlElement
+            
+        Raises:
+            ImportError: If lxml is not installed
+        """
+        if not LXML_AVAILABLE:
+            raise ImportError("lxml is required for get_lxml_tree")
+        return lxml.html.fromstring(html if html is not None else self.driver.page_source)
+    
+    def _bulk_probe(self, selectors: List[str] = (), include_html: bool = False) -> dict:
+        """
+        Read page state in one WebDriver call instead of one call per value.
+        
+        Args:
+            selectors: CSS selectors to test for presence (not clickability)
+            include_html: Whether to also return document outerHTML once the
+                page has finished loading
+            
+        Returns:
+            Dict with 'readyState', 'scrollHeight', 'viewportBottom',
+            'matches' (dict of selector -> bool) and 'html' (str or None)
+        """
+        selectors = list(selectors)
+        state = self.driver.execute_script(_BULK_PROBE_SCRIPT, selectors, include_html)
+        state['matches'] = dict(zip(selectors, state['matches']))
+        return state
+    
+    def get_dom_snapshot(self, computed_styles: List[str] = ()) -> Optional[dict]:
+        """
+        Capture the live DOM as structured data via CDP (Chromium only).
+        
+        Avoids serializing the page to HTML and re-parsing it, which makes
+        it cheaper than get_soup() for presence checks and attribute
+        extraction. See find_snapshot_elements() for querying the result.
+        
+        Args:
+            computed_styles: CSS properties to include per layout node
+            
+        Returns:
+            DOMSnapshot.captureSnapshot result, or None if the driver has no
+            CDP support (use get_soup() instead)
+        """
+        if not hasattr(self.driver, 'execute_cdp_cmd'):
+            return None
+        try:
+            return self.driver.execute_cdp_cmd(
+                'DOMSnapshot.captureSnapshot',
+                {'computedStyles': list(computed_styles)}
+            )
+        except Exception as e:
+            self.logger.debug("DOM snapshot unavailable: %s", e)
+            return None
+    
+    @staticmethod
+    def find_snapshot_elements(snapshot: dict, tag: str) -> List[dict]:
+        """
+        Find elements by tag name in a get_dom_snapshot() result.
+        
+        Args:
+            snapshot: Result of get_dom_snapshot()
+            tag: Element tag name (e.g. 'a', 'img')
+            
+        Returns:
+            List of attribute dictionaries, one per matching element
+        """
+        strings = snapshot['strings']
+        try:
+            tag_index = strings.index(tag.upper())
+        except ValueError:
+            return []
+        
+        elements = []
+        for document in snapshot['documents']:
+            nodes = document['nodes']
+            for node_name, attributes in zip(nodes['nodeName'], nodes['attributes']):
+                if node_name == tag_index:
+                    elements.append({
+                        strings[attributes[i]]: strings[attributes[i + 1]]
+                        for i in range(0, len(attributes), 2)
+                    })
+        return elements
+    
+    def xpath_local(self, expr, tree: Optional["lxml.html.HtmlElement"] = None) -> list:
+        """
+        Evaluate an XPath expression against a parsed page, without WebDriver calls.
+        
+        Args:
+            expr: XPath expression string (compiled once, in a bounded cache) or a
+                precompiled lxml.etree.XPath, e.g. from ScrapedItem metadata
+            tree: Parsed tree from get_lxml_tree(); parsed from the current page if omitted
+            
+        Returns:
+            XPath result list
+            
+        Raises:
+            ImportError: If lxml is not installed
+        """
+        if tree is None:
+            tree = self.get_lxml_tree()
+        compiled = _compile_xpath(expr) if isinstance(expr, str) else expr
+        return compiled(tree)
     
     def is_element_xpath_present(self, element_xpath: str, timeout: int = 10) -> bool:
         """
@@ -145,29 +306,56 @@ class AbstractHandler(ABC):
             self.logger.error(f"Error clicking element with CSS '{element_css}': {e}")
             return False
     
-    def wait_page_load(self, timeout: int = 30):
+    def wait_page_load(self, timeout: int = 30, include_html: bool = False) -> Optional[dict]:
         """
         Wait for page to load completely.
         
+        With include_html, the poll that sees the loaded page also returns
+        its HTML, so get_soup(state['html']) needs no page_source call.
+        
         Args:
             timeout: Timeout in seconds
+            include_html: Whether to fetch the page HTML with the final poll
+            
+        Returns:
+            Final _bulk_probe() state, or None on timeout
         """
+        def loaded(_driver):
+            state = self._bulk_probe(include_html=include_html)
+            return state if state['readyState'] == 'complete' else False
+        
         try:
-            WebDriverWait(self.driver, timeout).until(
-                lambda d: d.execute_script('return document.readyState') == 'complete'
-            )
+            return WebDriverWait(self.driver, timeout).until(loaded)
         except TimeoutException:
             self.logger.warning(f"Page load timeout after {timeout}s")
+            return None
     
-    def scroll_down(self, pixels: int = 500):
+    def scroll_down(self, pixels: int = 500, scroll_timeout: float = 2.0) -> bool:
         """
-        Scroll down the page.
+        Scroll down the page and wait for lazily loaded content.
+        
+        Returns as soon as the page grows, or immediately if the viewport is
+        not yet at the bottom; only waits the full timeout at the end of a
+        page that does not load more content.
         
         Args:
             pixels: Number of pixels to scroll
+            scroll_timeout: Maximum seconds to wait for new content
+            
+        Returns:
+            True if more content is available below the viewport
         """
-        self.driver.execute_script(f"window.scrollBy(0, {pixels});")
-        time.sleep(0.5)  # Give time for content to load
+        old_height = self.driver.execute_script(_SCROLL_SCRIPT, pixels)
+        
+        def more_content(_driver):
+            state = self._bulk_probe()
+            return state['scrollHeight'] > old_height or state['viewportBottom'] < state['scrollHeight']
+        
+        try:
+            WebDriverWait(self.driver, scroll_timeout, poll_frequency=0.1).until(more_content)
+            return True
+        except TimeoutException:
+            return False
     
     def is_external_url(self, url: str, base_domain: str) -> bool:
         """
@@ -180,23 +368,55 @@ class AbstractHandler(ABC):
         Returns:
             True if URL is external
         """
-        from urllib.parse import urlparse
-        parsed = urlparse(url)
-        return parsed.netloc != '' and base_domain not in parsed.netloc
+        parsed = _cached_urlparse(url)
+        if parsed.netloc == '':
+            return False
+        host = (parsed.hostname or '').rstrip('.')
+        domain = base_domain.lower()
+        return not (host == domain or host.endswith('.' + domain))
     
-    def save_page_html(self, filename: str):
+    def save_page_html(self, filename: str) -> Optional[Future]:
         """
         Save current page HTML to file for debugging.
         
+        The HTML is captured immediately (the page may change afterwards),
+        while the disk write runs on a background thread so scraping can
+        continue. Call close() to wait for pending writes.
+        
         Args:
             filename: Path to save HTML file
+            
+        Returns:
+            Future completing when the file is written, or None if the browser is not open
         """
         if not self.driver:
             self.logger.warning("Browser is not open. Cannot save page HTML.")
-            return
+            return None
         
         html_content = self.driver.page_source
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        self.logger.info(f"Saved page HTML to '{filename}'")
-
+        if self._save_pool is None:
+            self._save_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="save-html")
+        
+        future = self._save_pool.submit(_write_text, filename, html_content)
+        future.add_done_callback(lambda f: self._log_saved_html(filename, f))
+        return future
+    
+    def _log_saved_html(self, filename: str, future: Future):
+        """Report the outcome of a background save_page_html write."""
+        error = future.exception()
+        if error is None:
+            self.logger.info(f"Saved page HTML to '{filename}'")
+        else:
+            self.logger.error(f"Failed to save page HTML to '{filename}': {error}")
+    
+    def close(self):
+        """Wait for pending background page saves and release their thread."""
+        if self._save_pool is not None:
+            self._save_pool.shutdown(wait=True)
+            self._save_pool = None
+    
+    def __enter__(self) -> "AbstractHandler":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -3,9 +3,34 @@ Utility functions and validators for handlers.
 """
 
 import re
+from functools import lru_cache
 from typing import Optional
 from urllib.parse import urlparse
 
+# Optional XPath compilation for AbstractHandler.xpath_local
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# Pipelines parse the same URLs repeatedly; ParseResult is immutable
+_cached_urlparse = lru_cache(maxsize=8192)(urlparse)
+
+# Handlers evaluate the same XPath expressions on every page; bounded for dynamic ones
+_compile_xpath = lru_cache(maxsize=1024)(etree.XPath) if LXML_AVAILABLE else None
+
+# Patterns used on every normalize/clean call
+_WS_RE = re.compile(r'\s+')
+_NON_ALNUM_RE = re.compile(r'[^a-zA-Z0-9\s]')
+
+# ASCII fast path for clean_name: lowercase letters, keep digits and
+# whitespace, delete everything else in a single str.translate pass
+_CLEAN_TABLE = {
+    c: (chr(c).lower() if chr(c).isalnum() or chr(c).isspace() else None)
+    for c in range(128)
+}
+
 
 class URLValidator:
     """URL validation utilities."""
@@ -25,7 +50,7 @@ class URLValidator:
             return False
         
         try:
-            result = urlparse(url)
+            result = _cached_urlparse(url)
             return all([result.scheme, result.netloc])
         except Exception:
             return False
@@ -43,8 +68,14 @@ class URLValidator:
             True if URL is external
         """
         try:
-            parsed = urlparse(url)
-            return parsed.netloc != '' and base_domain not in parsed.netloc
+            parsed = _cached_urlparse(url)
+            if parsed.netloc == '':
+                return False
+            # Same host or a subdomain of it; a plain substring test would also
+            # accept hosts like 'example.com.attacker.net'
+            host = (parsed.hostname or '').rstrip('.')
+            domain = base_domain.lower()
+            return not (host == domain or host.endswith('.' + domain))
         except Exception:
             return False
     
@@ -60,7 +91,7 @@ class URLValidator:
             Normalized URL
         """
         try:
-            parsed = urlparse(url)
+            parsed = _cached_urlparse(url)
             return f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
         except Exception:
             return url
@@ -106,7 +137,7 @@ class NameValidator:
         name = name.strip()
         
         # Replace multiple spaces with single space
-        name = re.sub(r'\s+', ' ', name)
+        name = _WS_RE.sub(' ', name)
         
         return name
     
@@ -124,17 +155,20 @@ class NameValidator:
         if not name:
             return ""
         
+        if name.isascii():
+            return _WS_RE.sub(' ', name.translate(_CLEAN_TABLE)).strip()
+        
         # Normalize first
         name = NameValidator.normalize_name(name)
         
         # Remove special characters (keep alphanumeric and spaces)
-        name = re.sub(r'[^a-zA-Z0-9\s]', '', name)
+        name = _NON_ALNUM_RE.sub('', name)
         
         # Convert to lowercase
         name = name.lower()
         
         # Remove extra spaces
-        name = re.sub(r'\s+', ' ', name).strip()
+        name = _WS_RE.sub(' ', name).strip()
         
         return name
 
@@ -4,7 +4,7 @@ Base pipeline classes and interfaces.
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional, Union
 
 from toolkit.pipeline.item import ScrapedItem
 from toolkit.pipeline.context import PipelineContext
@@ -51,29 +51,68 @@ class AbstractPipeline(ABC):
             context: Optional PipelineContext (uses self.context if not provided)
             
         Returns:
-            Processed ScrapedItem, None if item should be dropped, or raises DropItem
+            Processed ScrapedItem, or None if the item was dropped (including
+            via DropItem raised from process_item)
         """
         if context:
             self.set_context(context)
         
         try:
-            self.logger.debug(f"Processing item: {item.name} (source: {item.source})")
+            self.logger.debug("Processing item: %s (source: %s)", item.name, item.source)
             result = self.process_item(item)
             
             if result is None:
-                self.logger.debug(f"Item dropped by {self.name}: {item.name}")
+                self.logger.debug("Item dropped by %s: %s", self.name, item.name)
             else:
-                self.logger.debug(f"Item processed successfully by {self.name}: {result.name}")
+                self.logger.debug("Item processed successfully by %s: %s", self.name, result.name)
             
             return result
             
         except DropItem as e:
+            # Convert at the stage boundary so callers only check for None
             self.logger.info(f"Item dropped by {self.name}: {item.name} - {str(e)}")
-            raise
+            return None
         except Exception as e:
-            self.logger.error(f"Error processing item in {self.name}: {e}", exc_info=True)
+            # Traceback only at DEBUG; the orchestrator reports it otherwise
+            self.logger.error(
+                f"Error processing item in {self.name}: {e}",
+                exc_info=self.logger.isEnabledFor(logging.DEBUG)
+            )
             raise
     
+    def process_batch(
+        self,
+        items: List[ScrapedItem],
+        context: Optional[PipelineContext] = None
+    ) -> List[Union[ScrapedItem, Exception, None]]:
+        """
+        Process a batch of items through this pipeline stage.
+        
+        Used by PipelineOrchestrator.execute_batched(). The default runs
+        process() per item, so one failing item does not affect the rest
+        of the batch; override to handle the whole list at once (e.g. one
+        bulk query or a vectorized transform).
+        
+        Args:
+            items: ScrapedItems to process
+            context: Optional PipelineContext (uses self.context if not provided)
+            
+        Returns:
+            One entry per input item: the processed item, None if dropped,
+            or the exception raised while processing it
+        """
+        if context:
+            self.set_context(context)
+        process = self.process
+        results = []
+        for item in items:
+            try:
+                results.append(process(item))
+            except Exception as e:
+                # Already logged by process(); the orchestrator counts it
+                results.append(e)
+        return results
+    
     @abstractmethod
     def process_item(self, item: ScrapedItem) -> Optional[ScrapedItem]:
         """
@@ -86,9 +125,10 @@ class AbstractPipeline(ABC):
             
         Returns:
             Processed ScrapedItem or None if item should be dropped
+            (preferred over raising DropItem, which is slower)
             
         Raises:
-            DropItem: To explicitly drop the item
+            DropItem: Alternative way to drop the item, e.g. from nested helpers
         """
         raise NotImplementedError
     
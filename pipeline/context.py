@@ -2,6 +2,8 @@
 Pipeline context for sharing state across pipeline stages.
 """
 
+import threading
+import time
 from typing import Dict, Any, Optional
 from datetime import datetime, timezone
 
@@ -21,9 +23,13 @@ class PipelineContext:
             session_id: Optional session ID for tracking
         """
         self.session_id = session_id
+        # Wall-clock start for reporting; durations use the monotonic clock
         self.start_time = datetime.now(timezone.utc)
+        self._start_monotonic = time.monotonic()
         self.data: Dict[str, Any] = {}
         self.stats: Dict[str, Any] = {}
+        # Stages may update stats from orchestrator worker threads
+        self._stats_lock = threading.Lock()
     
     def set(self, key: str, value: Any):
         """
@@ -56,7 +62,8 @@ class PipelineContext:
             stat_name: Name of the statistic
             amount: Amount to increment by
         """
-        self.stats[stat_name] = self.stats.get(stat_name, 0) + amount
+        with self._stats_lock:
+            self.stats[stat_name] = self.stats.get(stat_name, 0) + amount
     
     def get_stat(self, stat_name: str, default: int = 0) -> int:
         """
@@ -78,6 +85,5 @@ class PipelineContext:
         Returns:
             Duration in seconds
         """
-        duration = datetime.now(timezone.utc) - self.start_time
-        return duration.total_seconds()
+        return time.monotonic() - self._start_monotonic
 
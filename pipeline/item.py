@@ -2,18 +2,32 @@
 Generic scraped item data class for pipeline processing.
 """
 
+import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
 
+# Optional XPath compilation for '*_xpath' metadata (add_metadata compile_pattern)
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
 
-@dataclass
+# Shared across items so each distinct pattern is compiled once
+_compile_regex = lru_cache(maxsize=256)(re.compile)
+_compile_xpath = lru_cache(maxsize=256)(etree.XPath) if LXML_AVAILABLE else None
+
+
+@dataclass(slots=True)
 class ScrapedItem:
     """
     Generic data class for scraped items.
     
     This is the primary data transfer object used throughout the pipeline.
     Users should extend this class or create their own dataclass for
-    domain-specific fields.
+    domain-specific fields. Instances use __slots__, so ad-hoc attributes
+    cannot be set; store extra values in `metadata` instead.
     """
     # Essential identifiers
     source: str  # Source identifier (e.g., 'site1', 'scraper_name')
@@ -42,8 +56,21 @@ class ScrapedItem:
     local_image_paths: List[str] = field(default_factory=list)
     local_video_paths: List[str] = field(default_factory=list)
     
-    def add_metadata(self, key: str, value: Any):
-        """Add metadata to the item."""
+    def add_metadata(self, key: str, value: Any, compile_pattern: bool = False):
+        """
+        Add metadata to the item.
+        
+        With compile_pattern=True, a string value under a key ending in
+        '_xpath' is stored as a compiled lxml.etree.XPath (when lxml is
+        installed), and any other string value as a compiled re.Pattern.
+        Invalid patterns then raise re.error / lxml.etree.XPathSyntaxError.
+        """
+        if compile_pattern and isinstance(value, str):
+            if key.endswith('_xpath'):
+                if LXML_AVAILABLE:
+                    value = _compile_xpath(value)
+            else:
+                value = _compile_regex(value)
         self.metadata[key] = value
     
     def get_metadata(self, key: str, default: Any = None) -> Any:
@@ -2,8 +2,13 @@
 Pipeline orchestrator for executing multi-stage pipelines.
 """
 
+import asyncio
 import logging
-from typing import List, Optional, Iterator, Callable
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import List, Optional, Iterable, Iterator, Callable, Tuple, Union, AsyncIterable
 from toolkit.pipeline.base import AbstractPipeline
 from toolkit.pipeline.item import ScrapedItem
 from toolkit.pipeline.context import PipelineContext
@@ -15,17 +20,32 @@ class PipelineOrchestrator:
     Orchestrates execution of multiple pipeline stages.
     
     Manages pipeline stage execution, error handling, and statistics.
+    With max_workers > 1, items run through the stages concurrently on a
+    thread pool; stages must then be thread-safe.
     """
     
-    def __init__(self, pipelines: List[AbstractPipeline], context: Optional[PipelineContext] = None):
+    def __init__(
+        self,
+        pipelines: List[AbstractPipeline],
+        context: Optional[PipelineContext] = None,
+        max_workers: int = 1,
+        verbose_errors: bool = False
+    ):
         """
         Initialize PipelineOrchestrator.
         
         Args:
             pipelines: List of pipeline stages to execute in order
             context: Optional PipelineContext for sharing state
+            max_workers: Number of items processed concurrently (1 = sequential)
+            verbose_errors: Log a traceback for every failed item instead of
+                only the first failure of each exception type
         """
         self.pipelines = pipelines
+        self.max_workers = max_workers
+        self.verbose_errors = verbose_errors
+        # Exception types whose traceback has already been logged
+        self._seen_error_types: set = set()
         self.context = context or PipelineContext()
         self.logger = logging.getLogger(self.__class__.__name__)
         
@@ -33,6 +53,9 @@ class PipelineOrchestrator:
         for pipeline in self.pipelines:
             pipeline.set_context(self.context)
         
+        # Per-item runner specialized to the current stage list
+        self._run = self._build_runner()
+        
         # Statistics
         self.stats = {
             'total_items': 0,
@@ -51,48 +74,278 @@ class PipelineOrchestrator:
         Returns:
             List of successfully processed items
         """
-        self.logger.info(f"Starting pipeline execution with {len(self.pipelines)} stages")
+        self._initialize_pipelines()
         
-        # Initialize all pipelines
-        for pipeline in self.pipelines:
+        # Pick up any direct changes to self.pipelines since the last run
+        self._run = self._build_runner()
+        
+        # Preallocate when the input size is known; unused slots are trimmed
+        try:
+            processed_items = [None] * len(items)
+        except TypeError:
+            processed_items = []
+        capacity = len(processed_items)
+        
+        # Count in locals and fold into self.stats once at the end
+        total = processed = dropped = errors = 0
+        
+        try:
+            # Process each item through all pipeline stages
+            if self.max_workers > 1:
+                executor = ThreadPoolExecutor(max_workers=self.max_workers)
+                outcomes = self._submit_bounded(executor, items, 2 * self.max_workers)
+            else:
+                executor = None
+                outcomes = map(self._try_process, items)
+            
             try:
-                pipeline.initialize()
-            except Exception as e:
-                self.logger.error(f"Error initializing pipeline {pipeline.name}: {e}")
-                raise PipelineError(f"Pipeline initialization failed: {e}")
+                for item, processed_item, error in outcomes:
+                    total += 1
+                    
+                    if error is not None:
+                        errors += 1
+                        self.logger.error(f"Error processing item {item.name}: {error}", exc_info=self._exc_info(error))
+                    elif processed_item is None:
+                        dropped += 1
+                    else:
+                        if processed < capacity:
+                            processed_items[processed] = processed_item
+                        else:
+                            processed_items.append(processed_item)
+                        processed += 1
+            finally:
+                if executor is not None:
+                    executor.shutdown()
+                self.stats['total_items'] += total
+                self.stats['processed_items'] += processed
+                self.stats['dropped_items'] += dropped
+                self.stats['error_items'] += errors
+            
+            del processed_items[processed:]
+        
+        finally:
+            self._finalize_pipelines()
+        
+        self._log_completion()
+        
+        return processed_items
+    
+    def execute_batched(self, items: Iterable[ScrapedItem], batch_size: int = 256) -> List[ScrapedItem]:
+        """
+        Execute pipeline on items in batches, stage by stage.
+        
+        Each batch passes through every stage's process_batch() before the
+        next batch starts, so stages that override it can work on whole
+        lists at once (bulk DB queries, vectorized transforms). Dropped
+        items are filtered out between stages.
+        
+        Items that fail in a stage (returned as exceptions by the default
+        process_batch()) are counted as errors individually. If a stage's
+        process_batch() itself raises, the remaining items of that batch
+        are counted as errors.
         
+        Args:
+            items: Iterable of ScrapedItem instances
+            batch_size: Number of items per batch
+            
+        Returns:
+            List of successfully processed items
+        """
+        self._initialize_pipelines()
+        
+        iterator = iter(items)
         processed_items = []
+        total = dropped = errors = 0
         
         try:
-            # Process each item through all pipeline stages
-            for item in items:
-                self.stats['total_items'] += 1
+            while True:
+                batch = list(islice(iterator, batch_size))
+                if not batch:
+                    break
+                total += len(batch)
                 
-                try:
-                    processed_item = self._process_through_pipelines(item)
+                for pipeline in self.pipelines:
+                    try:
+                        results = pipeline.process_batch(batch, self.context)
+                    except Exception as e:
+                        errors += len(batch)
+                        self.logger.error(f"Error processing batch in {pipeline.name}: {e}", exc_info=self._exc_info(e))
+                        batch = []
+                        break
                     
-                    if processed_item:
-                        processed_items.append(processed_item)
-                        self.stats['processed_items'] += 1
-                    else:
-                        self.stats['dropped_items'] += 1
-                        
-                except DropItem:
-                    self.stats['dropped_items'] += 1
-                    continue
-                except Exception as e:
-                    self.stats['error_items'] += 1
-                    self.logger.error(f"Error processing item {item.name}: {e}", exc_info=True)
-                    continue
+                    kept = []
+                    for item, result in zip(batch, results):
+                        if isinstance(result, Exception):
+                            errors += 1
+                            self.logger.error(f"Error processing item {item.name}: {result}", exc_info=self._exc_info(result))
+                        elif result is None:
+                            dropped += 1
+                        else:
+                            kept.append(result)
+                    batch = kept
+                    if not batch:
+                        break
+                
+                processed_items.extend(batch)
         
         finally:
-            # Finalize all pipelines
-            for pipeline in self.pipelines:
-                try:
-                    pipeline.finalize()
-                except Exception as e:
-                    self.logger.warning(f"Error finalizing pipeline {pipeline.name}: {e}")
+            self.stats['total_items'] += total
+            self.stats['processed_items'] += len(processed_items)
+            self.stats['dropped_items'] += dropped
+            self.stats['error_items'] += errors
+            self._finalize_pipelines()
+        
+        self._log_completion()
+        
+        return processed_items
+    
+    async def execute_async(
+        self,
+        items: Union[Iterable[ScrapedItem], AsyncIterable[ScrapedItem]],
+        concurrency: int = 8
+    ) -> List[ScrapedItem]:
+        """
+        Execute pipeline from an event loop, processing items concurrently.
+        
+        Items are dispatched to a worker pool as they arrive, so an async
+        producer (e.g. handlers driven through AsyncHandlerAdapter) overlaps
+        with processing. Stages must be thread-safe when concurrency > 1.
+        
+        Args:
+            items: Iterable or async iterable of ScrapedItem instances
+            concurrency: Maximum number of items processed at once
+            
+        Returns:
+            List of successfully processed items, in input order
+        """
+        self._initialize_pipelines()
+        self._run = self._build_runner()
         
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        # Bounds submitted, unfinished items so a fast producer cannot queue everything
+        semaphore = asyncio.Semaphore(concurrency)
+        futures = []
+        processed_items = []
+        total = dropped = errors = 0
+        
+        def release(_future):
+            semaphore.release()
+        
+        async def submit(item: ScrapedItem):
+            await semaphore.acquire()
+            future = loop.run_in_executor(executor, self._try_process, item)
+            future.add_done_callback(release)
+            futures.append(future)
+        
+        try:
+            if hasattr(items, '__aiter__'):
+                async for item in items:
+                    await submit(item)
+            else:
+                for item in items:
+                    await submit(item)
+            
+            for item, processed_item, error in await asyncio.gather(*futures):
+                total += 1
+                
+                if error is not None:
+                    errors += 1
+                    self.logger.error(f"Error processing item {item.name}: {error}", exc_info=self._exc_info(error))
+                elif processed_item is None:
+                    dropped += 1
+                else:
+                    processed_items.append(processed_item)
+        
+        finally:
+            # Stages must not be finalized while workers are still inside
+            # process(); wait for them on another thread to keep the loop free
+            await loop.run_in_executor(None, partial(executor.shutdown, wait=True, cancel_futures=True))
+            self.stats['total_items'] += total
+            self.stats['processed_items'] += len(processed_items)
+            self.stats['dropped_items'] += dropped
+            self.stats['error_items'] += errors
+            self._finalize_pipelines()
+        
+        self._log_completion()
+        
+        return processed_items
+    
+    def _submit_bounded(
+        self,
+        executor: ThreadPoolExecutor,
+        items: Iterable[ScrapedItem],
+        window: int
+    ) -> Iterator[Tuple[ScrapedItem, Optional[ScrapedItem], Optional[Exception]]]:
+        """
+        Process items on an executor, yielding outcomes in input order.
+        
+        Unlike executor.map, at most window items are read from the input
+        and submitted ahead of the consumer, so generator inputs still stream.
+        
+        Args:
+            executor: Executor running _try_process
+            items: Iterable of ScrapedItem instances
+            window: Maximum number of submitted, unconsumed items
+            
+        Returns:
+            Iterator of _try_process outcomes
+        """
+        pending = deque()
+        for item in items:
+            if len(pending) >= window:
+                yield pending.popleft().result()
+            pending.append(executor.submit(self._try_process, item))
+        while pending:
+            yield pending.popleft().result()
+    
+    def _exc_info(self, error: BaseException):
+        """
+        Decide whether to attach a traceback when logging an item error.
+        
+        Formatting tracebacks is costly in pipelines with many failures, so
+        by default only the first error of each type gets one.
+        
+        Args:
+            error: Exception being logged
+            
+        Returns:
+            The exception if its traceback should be logged, otherwise False
+        """
+        if self.verbose_errors or self.logger.isEnabledFor(logging.DEBUG):
+            return error
+        error_type = type(error)
+        if error_type in self._seen_error_types:
+            return False
+        self._seen_error_types.add(error_type)
+        return error
+    
+    def _initialize_pipelines(self):
+        """
+        Initialize all pipeline stages before a run.
+        
+        Raises:
+            PipelineError: If any stage fails to initialize
+        """
+        self.logger.info(f"Starting pipeline execution with {len(self.pipelines)} stages")
+        
+        for pipeline in self.pipelines:
+            try:
+                pipeline.initialize()
+            except Exception as e:
+                self.logger.error(f"Error initializing pipeline {pipeline.name}: {e}")
+                raise PipelineError(f"Pipeline initialization failed: {e}")
+    
+    def _finalize_pipelines(self):
+        """Finalize all pipeline stages after a run, logging failures."""
+        for pipeline in self.pipelines:
+            try:
+                pipeline.finalize()
+            except Exception as e:
+                self.logger.warning(f"Error finalizing pipeline {pipeline.name}: {e}")
+    
+    def _log_completion(self):
+        """Log the cumulative execution statistics."""
         self.logger.info(
             f"Pipeline execution complete. "
             f"Total: {self.stats['total_items']}, "
@@ -100,31 +353,51 @@ class PipelineOrchestrator:
             f"Dropped: {self.stats['dropped_items']}, "
             f"Errors: {self.stats['error_items']}"
         )
-        
-        return processed_items
     
-    def _process_through_pipelines(self, item: ScrapedItem) -> Optional[ScrapedItem]:
+    def _try_process(
+        self,
+        item: ScrapedItem
+    ) -> Tuple[ScrapedItem, Optional[ScrapedItem], Optional[Exception]]:
         """
-        Process item through all pipeline stages sequentially.
+        Run one item through the stages, capturing the outcome.
         
         Args:
             item: ScrapedItem to process
             
         Returns:
-            Processed ScrapedItem or None if dropped
+            (item, processed item or None if dropped, exception or None)
+        """
+        try:
+            return item, self._run(item), None
+        except DropItem:
+            # Only reachable from stages that override process()
+            return item, None, None
+        except Exception as e:
+            return item, None, e
+    
+    def _build_runner(self) -> Callable[[ScrapedItem], Optional[ScrapedItem]]:
         """
-        current_item = item
+        Build the per-item function for the current pipeline stages.
         
-        for pipeline in self.pipelines:
-            if current_item is None:
-                return None
-            
-            current_item = pipeline.process(current_item, self.context)
-            
-            if current_item is None:
-                return None
+        Stage process() methods and the context are bound once here, so the
+        per-item loop does no attribute lookups. Rebuilt whenever the stage
+        list changes through add_pipeline/insert_pipeline and at the start
+        of each execute().
+        
+        Returns:
+            Function taking an item and returning the processed item or None
+        """
+        stages = tuple(pipeline.process for pipeline in self.pipelines)
+        context = self.context
+        
+        def run(item: ScrapedItem) -> Optional[ScrapedItem]:
+            for process in stages:
+                item = process(item, context)
+                if item is None:
+                    return None
+            return item
         
-        return current_item
+        return run
     
     def get_stats(self) -> dict:
         """
@@ -144,6 +417,7 @@ class PipelineOrchestrator:
         """
         pipeline.set_context(self.context)
         self.pipelines.append(pipeline)
+        self._run = self._build_runner()
         self.logger.debug(f"Added pipeline stage: {pipeline.name}")
     
     def insert_pipeline(self, index: int, pipeline: AbstractPipeline):
@@ -156,5 +430,6 @@ class PipelineOrchestrator:
         """
         pipeline.set_context(self.context)
         self.pipelines.insert(index, pipeline)
+        self._run = self._build_runner()
         self.logger.debug(f"Inserted pipeline stage at index {index}: {pipeline.name}")
 
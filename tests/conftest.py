@@ -0,0 +1,89 @@
+"""
+Shared pytest fixtures.
+
+The toolkit is imported as the `toolkit` package (it is meant to be copied
+into projects under that name), so the repository root is registered under
+that name before any test module imports it.
+"""
+
+import importlib.util
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+if 'toolkit' not in sys.modules:
+    _spec = importlib.util.spec_from_file_location(
+        'toolkit', ROOT / '__init__.py', submodule_search_locations=[str(ROOT)]
+    )
+    _toolkit = importlib.util.module_from_spec(_spec)
+    sys.modules['toolkit'] = _toolkit
+    _spec.loader.exec_module(_toolkit)
+
+
+BODY = bytes(range(256)) * 64
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """
+    Serves BODY on every path, with a few behaviours selected by path.
+    
+    /truncated  drops the connection after 1000 bytes on the first request
+    /missing    responds 404
+    /redirect   responds 302 to /file
+    """
+    
+    protocol_version = 'HTTP/1.1'
+    
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.hits[self.path] = server.hits.get(self.path, 0) + 1
+            hits = server.hits[self.path]
+        
+        if self.path == '/redirect':
+            self.send_response(302)
+            self.send_header('Location', '/file')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        
+        if self.path == '/missing':
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(BODY)))
+        self.end_headers()
+        
+        if self.path == '/truncated' and hits == 1:
+            self.wfile.write(BODY[:1000])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        
+        self.wfile.write(BODY)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def http_server():
+    """Local HTTP server; yields it with `url(path)` and per-path `hits`."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    server.daemon_threads = True
+    server.hits = {}
+    server.lock = threading.Lock()
+    server.url = lambda path: f"http://127.0.0.1:{server.server_port}{path}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
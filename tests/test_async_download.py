@@ -0,0 +1,40 @@
+"""
+Tests for the aiohttp-based AsyncHTTPDownloadStrategy.
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip('aiohttp')
+
+from conftest import BODY
+from toolkit.core.download.config import DownloadConfig
+from toolkit.core.download.strategies import AsyncHTTPDownloadStrategy
+
+
+def test_download_writes_body(http_server, tmp_path):
+    strategy = AsyncHTTPDownloadStrategy(DownloadConfig(timeout=5))
+    destination = tmp_path / 'nested' / 'file.bin'
+    
+    assert asyncio.run(strategy.download(http_server.url('/file'), destination))
+    assert destination.read_bytes() == BODY
+
+
+def test_download_returns_false_on_http_error(http_server, tmp_path):
+    strategy = AsyncHTTPDownloadStrategy(DownloadConfig(timeout=5))
+    
+    assert not asyncio.run(strategy.download(http_server.url('/missing'), tmp_path / 'file.bin'))
+
+
+def test_download_many_reports_results_in_input_order(http_server, tmp_path):
+    strategy = AsyncHTTPDownloadStrategy(DownloadConfig(timeout=5))
+    items = [
+        (http_server.url('/a'), tmp_path / 'a.bin'),
+        (http_server.url('/missing'), tmp_path / 'missing.bin'),
+        (http_server.url('/b'), tmp_path / 'b.bin'),
+    ]
+    
+    assert asyncio.run(strategy.download_many(items, limit=2)) == [True, False, True]
+    assert (tmp_path / 'a.bin').read_bytes() == BODY
+    assert (tmp_path / 'b.bin').read_bytes() == BODY
@@ -0,0 +1,93 @@
+"""
+Tests for the batching DatabaseHandler.
+"""
+
+import logging
+import time
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from toolkit.core.logging.handlers import DatabaseHandler
+
+
+class RecordingHandler(DatabaseHandler):
+    """Records inserted batches instead of writing to a database."""
+    
+    def __init__(self, **kwargs):
+        super().__init__(None, **kwargs)
+        self.batches = []
+    
+    def _insert_logs(self, log_entries: list):
+        self.batches.append([entry['message'] for entry in log_entries])
+
+
+def _record(message: str) -> logging.LogRecord:
+    return logging.LogRecord('test', logging.INFO, __file__, 1, message, None, None)
+
+
+def test_flushes_when_batch_size_is_reached():
+    handler = RecordingHandler(batch_size=3, max_wait=60)
+    try:
+        for i in range(7):
+            handler.handle(_record(f'message {i}'))
+        
+        assert handler.batches == [
+            ['message 0', 'message 1', 'message 2'],
+            ['message 3', 'message 4', 'message 5'],
+        ]
+    finally:
+        handler.close()
+
+
+def test_close_flushes_remaining_entries_and_stops_flusher():
+    handler = RecordingHandler(batch_size=100, max_wait=60)
+    handler.handle(_record('first'))
+    handler.handle(_record('second'))
+    assert handler.batches == []
+    
+    handler.close()
+    
+    assert handler.batches == [['first', 'second']]
+    assert not handler._flusher.is_alive()
+
+
+def test_background_thread_flushes_after_max_wait():
+    handler = RecordingHandler(batch_size=100, max_wait=0.1)
+    try:
+        handler.handle(_record('waiting'))
+        deadline = time.monotonic() + 5
+        while not handler.batches and time.monotonic() < deadline:
+            time.sleep(0.02)
+        
+        assert handler.batches == [['waiting']]
+    finally:
+        handler.close()
+
+
+def test_writes_batches_with_sqlalchemy_session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'logs.db'}")
+    with engine.begin() as connection:
+        connection.execute(text(
+            "CREATE TABLE logs (level TEXT, message TEXT, source TEXT, "
+            "session_id TEXT, entity_id TEXT, timestamp TIMESTAMP)"
+        ))
+    session = sessionmaker(bind=engine)()
+    
+    handler = DatabaseHandler(session, batch_size=2, max_wait=60)
+    for i in range(3):
+        record = _record(f'message {i}')
+        record.context = {'session_id': 'abc', 'entity_id': str(i)}
+        handler.handle(record)
+    handler.close()
+    
+    with engine.connect() as connection:
+        rows = connection.execute(text("SELECT message, session_id, entity_id FROM logs ORDER BY entity_id")).all()
+    session.close()
+    engine.dispose()
+    
+    assert [tuple(row) for row in rows] == [
+        ('message 0', 'abc', '0'),
+        ('message 1', 'abc', '1'),
+        ('message 2', 'abc', '2'),
+    ]
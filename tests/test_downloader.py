@@ -0,0 +1,66 @@
+"""
+Tests for FileDownloader retry behaviour.
+"""
+
+from conftest import BODY
+from toolkit.core.download.config import DownloadConfig, RetryPolicy
+from toolkit.core.download.downloader import FileDownloader
+from toolkit.core.download.strategies import HTTPDownloadStrategy
+
+
+def _downloader(max_retries: int = 3) -> FileDownloader:
+    policy = RetryPolicy(max_retries=max_retries, base_delay=0.01, backoff_factor=0)
+    return FileDownloader(DownloadConfig(timeout=5, retry_policy=policy))
+
+
+def test_download_writes_body(http_server, tmp_path):
+    destination = tmp_path / 'nested' / 'file.bin'
+    
+    assert _downloader().download(http_server.url('/file'), destination)
+    assert destination.read_bytes() == BODY
+
+
+def test_body_truncated_mid_stream_is_retried(http_server, tmp_path):
+    destination = tmp_path / 'file.bin'
+    
+    assert _downloader().download(http_server.url('/truncated'), destination)
+    assert http_server.hits['/truncated'] == 2
+    assert destination.read_bytes() == BODY
+
+
+def test_client_error_is_not_retried_by_outer_loop(http_server, tmp_path, caplog):
+    assert not _downloader().download(http_server.url('/missing'), tmp_path / 'file.bin')
+    assert http_server.hits['/missing'] == 1
+    assert "after 1 attempts" in caplog.text
+
+
+def test_standalone_strategy_reuses_one_pooled_session(http_server, tmp_path):
+    strategy = HTTPDownloadStrategy(DownloadConfig(timeout=5))
+    
+    assert strategy.download(http_server.url('/a'), tmp_path / 'a.bin')
+    session = strategy.session
+    assert strategy.download(http_server.url('/b'), tmp_path / 'b.bin')
+    
+    assert session is not None and strategy.session is session
+    assert (tmp_path / 'b.bin').read_bytes() == BODY
+
+
+def test_downloader_shares_its_session_with_default_strategy():
+    downloader = _downloader()
+    
+    assert downloader.strategy.session is downloader.session
+
+
+def test_strategy_subclass_overriding_download_is_not_bypassed(http_server, tmp_path):
+    class ValidatingStrategy(HTTPDownloadStrategy):
+        calls = 0
+        
+        def download(self, url, destination, session=None, chunk_size=None):
+            ValidatingStrategy.calls += 1
+            return super().download(url, destination, session, chunk_size)
+    
+    config = DownloadConfig(timeout=5)
+    downloader = FileDownloader(config, ValidatingStrategy(config))
+    
+    assert downloader.download(http_server.url('/file'), tmp_path / 'file.bin')
+    assert ValidatingStrategy.calls == 1
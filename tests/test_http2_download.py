@@ -0,0 +1,54 @@
+"""
+Tests for the httpx-based HTTPXDownloadStrategy.
+
+The local server speaks HTTP/1.1 over plain TCP, so these exercise the
+client lifecycle and streaming rather than HTTP/2 multiplexing itself.
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip('httpx')
+
+from conftest import BODY
+from toolkit.core.download.config import DownloadConfig
+from toolkit.core.download.strategies_http2 import HTTPXDownloadStrategy
+
+
+def test_download_many_shares_one_client(http_server, tmp_path):
+    async def run():
+        async with HTTPXDownloadStrategy(DownloadConfig(timeout=5)) as strategy:
+            results = await strategy.download_many(
+                [(http_server.url(f'/{i}'), tmp_path / f'{i}.bin') for i in range(5)],
+                limit=2
+            )
+            client = strategy._client
+        return results, client, strategy._client
+    
+    results, client, client_after_close = asyncio.run(run())
+    
+    assert results == [True] * 5
+    assert all((tmp_path / f'{i}.bin').read_bytes() == BODY for i in range(5))
+    assert client is not None and client.is_closed
+    assert client_after_close is None
+
+
+def test_download_returns_false_on_http_error(http_server, tmp_path):
+    async def run():
+        async with HTTPXDownloadStrategy(DownloadConfig(timeout=5)) as strategy:
+            return await strategy.download(http_server.url('/missing'), tmp_path / 'file.bin')
+    
+    assert not asyncio.run(run())
+
+
+def test_download_follows_redirects(http_server, tmp_path):
+    destination = tmp_path / 'file.bin'
+    
+    async def run():
+        async with HTTPXDownloadStrategy(DownloadConfig(timeout=5)) as strategy:
+            return await strategy.download(http_server.url('/redirect'), destination)
+    
+    assert asyncio.run(run())
+    assert destination.read_bytes() == BODY
+    assert http_server.hits == {'/redirect': 1, '/file': 1}
@@ -0,0 +1,192 @@
+"""
+Tests for PipelineOrchestrator execution modes and the batched stage API.
+"""
+
+import asyncio
+import threading
+import time
+from typing import List, Optional
+
+import pytest
+
+from toolkit.pipeline.base import AbstractPipeline
+from toolkit.pipeline.exceptions import DropItem
+from toolkit.pipeline.item import ScrapedItem
+from toolkit.pipeline.orchestrator import PipelineOrchestrator
+
+
+class UppercaseStage(AbstractPipeline):
+    def process_item(self, item: ScrapedItem) -> Optional[ScrapedItem]:
+        item.clean_name = item.name.upper()
+        return item
+
+
+class DropOddStage(AbstractPipeline):
+    def process_item(self, item: ScrapedItem) -> Optional[ScrapedItem]:
+        index = int(item.name.split('-')[1])
+        if index % 3 == 0:
+            raise DropItem("multiple of three")
+        if index % 2:
+            return None
+        return item
+
+
+class BulkTagStage(AbstractPipeline):
+    """Overrides process_batch, recording the batch sizes it was given."""
+    
+    def __init__(self):
+        super().__init__()
+        self.batch_sizes: List[int] = []
+    
+    def process_item(self, item: ScrapedItem) -> Optional[ScrapedItem]:
+        item.add_metadata('tagged', True)
+        return item
+    
+    def process_batch(self, items, context=None):
+        self.batch_sizes.append(len(items))
+        return [self.process_item(item) for item in items]
+
+
+class FailOnFiveStage(AbstractPipeline):
+    def process_item(self, item: ScrapedItem) -> Optional[ScrapedItem]:
+        if item.name == 'item-5':
+            raise ValueError("bad item")
+        return item
+
+
+class FailingBatchStage(AbstractPipeline):
+    """Overrides process_batch with an implementation that always raises."""
+    
+    def process_item(self, item: ScrapedItem) -> Optional[ScrapedItem]:
+        return item
+    
+    def process_batch(self, items, context=None):
+        raise RuntimeError("bulk write failed")
+
+
+def _items(count: int) -> List[ScrapedItem]:
+    return [ScrapedItem(source='test', name=f'item-{i}', detail_url=f'https://example.com/{i}') for i in range(count)]
+
+
+def _summary(items: List[ScrapedItem]) -> List[tuple]:
+    return [(item.name, item.clean_name, dict(item.metadata)) for item in items]
+
+
+@pytest.mark.parametrize('batch_size', [1, 4, 7, 100])
+def test_batched_matches_unbatched(batch_size):
+    unbatched = PipelineOrchestrator([UppercaseStage(), DropOddStage(), BulkTagStage()])
+    batched = PipelineOrchestrator([UppercaseStage(), DropOddStage(), BulkTagStage()])
+    
+    expected = unbatched.execute(_items(25))
+    actual = batched.execute_batched(_items(25), batch_size=batch_size)
+    
+    assert _summary(actual) == _summary(expected)
+    assert batched.get_stats() == unbatched.get_stats()
+
+
+def test_batched_accepts_generators_and_skips_emptied_batches():
+    bulk = BulkTagStage()
+    orchestrator = PipelineOrchestrator([DropOddStage(), bulk])
+    
+    result = orchestrator.execute_batched((item for item in _items(10)), batch_size=4)
+    
+    assert [item.name for item in result] == ['item-2', 'item-4', 'item-8']
+    # Batches of 4, 4 and 2 items lose their dropped items before the bulk stage
+    assert bulk.batch_sizes == [1, 1, 1]
+
+
+def test_failing_item_does_not_discard_its_batch():
+    unbatched = PipelineOrchestrator([UppercaseStage(), FailOnFiveStage()])
+    batched = PipelineOrchestrator([UppercaseStage(), FailOnFiveStage()])
+    
+    expected = unbatched.execute(_items(10))
+    actual = batched.execute_batched(_items(10), batch_size=8)
+    
+    assert [item.name for item in actual] == [f'item-{i}' for i in range(10) if i != 5]
+    assert _summary(actual) == _summary(expected)
+    assert batched.get_stats() == {
+        'total_items': 10,
+        'processed_items': 9,
+        'dropped_items': 0,
+        'error_items': 1
+    }
+
+
+def test_raising_batch_override_counts_remaining_batch_as_errors():
+    orchestrator = PipelineOrchestrator([UppercaseStage(), FailingBatchStage()])
+    
+    assert orchestrator.execute_batched(_items(5), batch_size=2) == []
+    assert orchestrator.get_stats() == {
+        'total_items': 5,
+        'processed_items': 0,
+        'dropped_items': 0,
+        'error_items': 5
+    }
+
+
+class SlowStage(AbstractPipeline):
+    """Sleeps per item and records how many items were in flight at finalize()."""
+    
+    def __init__(self):
+        super().__init__()
+        self.lock = threading.Lock()
+        self.active = 0
+        self.active_at_finalize = None
+    
+    def process_item(self, item: ScrapedItem) -> Optional[ScrapedItem]:
+        with self.lock:
+            self.active += 1
+        time.sleep(0.05)
+        with self.lock:
+            self.active -= 1
+        return item
+    
+    def finalize(self):
+        self.active_at_finalize = self.active
+
+
+def test_async_matches_sequential():
+    sequential = PipelineOrchestrator([UppercaseStage(), DropOddStage(), FailOnFiveStage()])
+    concurrent = PipelineOrchestrator([UppercaseStage(), DropOddStage(), FailOnFiveStage()])
+    
+    async def produce():
+        for item in _items(20):
+            yield item
+    
+    expected = sequential.execute(_items(20))
+    actual = asyncio.run(concurrent.execute_async(produce(), concurrency=4))
+    
+    assert _summary(actual) == _summary(expected)
+    assert concurrent.get_stats() == sequential.get_stats()
+
+
+def test_async_cancellation_waits_for_workers_without_blocking_the_loop():
+    stage = SlowStage()
+    orchestrator = PipelineOrchestrator([stage])
+    produced = []
+    
+    async def produce():
+        for item in _items(100):
+            produced.append(item)
+            yield item
+    
+    async def run():
+        task = asyncio.create_task(orchestrator.execute_async(produce(), concurrency=4))
+        await asyncio.sleep(0.02)
+        task.cancel()
+        
+        # The loop keeps running while in-flight workers are drained
+        ticks = 0
+        while not task.done():
+            ticks += 1
+            await asyncio.sleep(0.005)
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return ticks
+    
+    ticks = asyncio.run(run())
+    
+    assert ticks > 1
+    assert stage.active_at_finalize == 0
+    # The semaphore kept the producer from running ahead of the workers
+    assert len(produced) <= 5
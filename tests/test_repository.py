@@ -0,0 +1,86 @@
+"""
+Tests for Repository bulk operations and DatabaseManager.unit_of_work.
+"""
+
+import pytest
+from sqlalchemy import Column, Integer, String
+from sqlalchemy.orm import declarative_base
+
+from toolkit.core.database.config import DatabaseConfig
+from toolkit.core.database.manager import DatabaseManager
+from toolkit.core.database.repository import Repository
+
+Base = declarative_base()
+
+
+class Product(Base):
+    __tablename__ = 'products'
+    
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+    price = Column(Integer, nullable=False)
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    manager = DatabaseManager(DatabaseConfig(f"sqlite:///{tmp_path / 'test.db'}"))
+    manager.create_all_tables(Base)
+    yield manager
+    manager.close()
+
+
+def test_bulk_add_inserts_across_batches(db_manager):
+    with db_manager.unit_of_work() as uow:
+        repository = uow.get_repository(Product)
+        products = [Product(id=i, name=f'product-{i}', price=i * 10) for i in range(1, 26)]
+        
+        assert repository.bulk_add(products, batch_size=10) == 25
+    
+    session = db_manager.create_session()
+    try:
+        repository = Repository(session, Product)
+        assert repository.count() == 25
+        assert repository.get_by_id(25).price == 250
+    finally:
+        session.close()
+
+
+def test_bulk_update_mappings_updates_by_primary_key(db_manager):
+    with db_manager.unit_of_work() as uow:
+        uow.get_repository(Product).bulk_add([Product(id=i, name=f'product-{i}', price=0) for i in range(1, 6)])
+    
+    with db_manager.unit_of_work() as uow:
+        mappings = [{'id': i, 'price': i * 100} for i in range(1, 6)]
+        assert uow.get_repository(Product).bulk_update_mappings(mappings, batch_size=2) == 5
+    
+    session = db_manager.create_session()
+    try:
+        prices = {product.id: product.price for product in Repository(session, Product).get_all()}
+        assert prices == {i: i * 100 for i in range(1, 6)}
+    finally:
+        session.close()
+
+
+def test_unit_of_work_rolls_back_on_error(db_manager):
+    with pytest.raises(RuntimeError):
+        with db_manager.unit_of_work() as uow:
+            uow.get_repository(Product).add(Product(id=1, name='discarded', price=1))
+            uow.flush()
+            raise RuntimeError("abort")
+    
+    session = db_manager.create_session()
+    try:
+        assert Repository(session, Product).count() == 0
+    finally:
+        session.close()
+
+
+def test_unit_of_work_uses_a_fresh_session_each_time(db_manager):
+    first = db_manager.unit_of_work()
+    second = db_manager.unit_of_work()
+    try:
+        assert first.session is not second.session
+        assert first.get_repository(Product) is first.get_repository(Product)
+    finally:
+        first.close()
+        second.close()